@@ -1,12 +1,20 @@
-import boto3
+import os
 from strands import Agent
+from botocore.config import Config as BotocoreConfig
 from strands.models import BedrockModel
 from strands_tools import calculator
 
 # Create a BedrockModel
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-pro-v1:0",
-    region_name="us-west-2"
+    region_name="us-west-2",
+    # Long streaming responses can exceed botocore's 60s default read timeout
+    boto_client_config=BotocoreConfig(
+        read_timeout=int(os.getenv("BEDROCK_READ_TIMEOUT", "300")),
+        connect_timeout=10,
+        retries={"max_attempts": 2, "mode": "adaptive"},
+        tcp_keepalive=True
+    )
 )
 
 agent = Agent(model=bedrock_model, tools=[calculator])
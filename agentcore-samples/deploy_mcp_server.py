@@ -1,15 +1,18 @@
+import asyncio
 import boto3
-import time
+import sys
 from bedrock_agentcore_starter_toolkit import Runtime
+from deploy_utils import wait_for_deployment
 
-def setup_cognito_user_pool():
+async def setup_cognito_user_pool():
 
     region = "us-west-2"
     # Initialize Cognito client
     cognito_client = boto3.client('cognito-idp', region_name=region)
     try:
         # Create User Pool
-        user_pool_response = cognito_client.create_user_pool(
+        user_pool_response = await asyncio.to_thread(
+            cognito_client.create_user_pool,
             PoolName='MCPServerPool',
             Policies={
                 'PasswordPolicy': {
@@ -18,33 +21,38 @@ def setup_cognito_user_pool():
             }
         )
         pool_id = user_pool_response['UserPool']['Id']
-        # Create App Client
-        app_client_response = cognito_client.create_user_pool_client(
-            UserPoolId=pool_id,
-            ClientName='MCPServerPoolClient',
-            GenerateSecret=False,
-            ExplicitAuthFlows=[
-                'ALLOW_USER_PASSWORD_AUTH',
-                'ALLOW_REFRESH_TOKEN_AUTH'
-            ]
+        # Create App Client and User concurrently, both only depend on the pool
+        app_client_response, _ = await asyncio.gather(
+            asyncio.to_thread(
+                cognito_client.create_user_pool_client,
+                UserPoolId=pool_id,
+                ClientName='MCPServerPoolClient',
+                GenerateSecret=False,
+                ExplicitAuthFlows=[
+                    'ALLOW_USER_PASSWORD_AUTH',
+                    'ALLOW_REFRESH_TOKEN_AUTH'
+                ]
+            ),
+            asyncio.to_thread(
+                cognito_client.admin_create_user,
+                UserPoolId=pool_id,
+                Username='testuser',
+                TemporaryPassword='Temp123!',
+                MessageAction='SUPPRESS'
+            )
         )
         client_id = app_client_response['UserPoolClient']['ClientId']
-        # Create User
-        cognito_client.admin_create_user(
-            UserPoolId=pool_id,
-            Username='testuser',
-            TemporaryPassword='Temp123!',
-            MessageAction='SUPPRESS'
-        )
         # Set Permanent Password
-        cognito_client.admin_set_user_password(
+        await asyncio.to_thread(
+            cognito_client.admin_set_user_password,
             UserPoolId=pool_id,
             Username='testuser',
             Password='MyPassword123!',
             Permanent=True
         )
         # Authenticate User and get Access Token
-        auth_response = cognito_client.initiate_auth(
+        auth_response = await asyncio.to_thread(
+            cognito_client.initiate_auth,
             ClientId=client_id,
             AuthFlow='USER_PASSWORD_AUTH',
             AuthParameters={
@@ -72,7 +80,7 @@ def setup_cognito_user_pool():
 
 
 print("Setting up Amazon Cognito user pool...")
-cognito_config = setup_cognito_user_pool()
+cognito_config = asyncio.run(setup_cognito_user_pool())
 print("Cognito setup completed")
 
 agentcore_runtime = Runtime()
@@ -105,12 +113,6 @@ print("Launch completed")
 print(f"Agent ARN: {launch_result.agent_arn}")
 
 # Wait for agent to be deployed
-status_response = agentcore_runtime.status()
-status = status_response.endpoint['status']
-end_status = ['READY', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_FAILED']
-while status not in end_status:
-    time.sleep(10)
-    status_response = agentcore_runtime.status()
-    status = status_response.endpoint['status']
-    print(status)
-
+status = asyncio.run(wait_for_deployment(agentcore_runtime))
+if status != 'READY':
+    sys.exit(f"Deployment did not become ready: {status}")
@@ -1,5 +1,7 @@
 from bedrock_agentcore_starter_toolkit import Runtime
-import time
+import asyncio
+import sys
+from deploy_utils import wait_for_deployment
 
 agentcore_runtime = Runtime()
 agent_name = "travel_agent"
@@ -15,14 +17,9 @@ response = agentcore_runtime.configure(
 launch_result = agentcore_runtime.launch()
 
 # Wait for agent to be deployed
-status_response = agentcore_runtime.status()
-status = status_response.endpoint['status']
-end_status = ['READY', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_FAILED']
-while status not in end_status:
-    time.sleep(10)
-    status_response = agentcore_runtime.status()
-    status = status_response.endpoint['status']
-    print(status)
+status = asyncio.run(wait_for_deployment(agentcore_runtime))
+if status != 'READY':
+    sys.exit(f"Deployment did not become ready: {status}")
 
 # Test the agent
 invoke_response = agentcore_runtime.invoke({"prompt": "Can you tell me travel options to Seattle?"})
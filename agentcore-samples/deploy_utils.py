@@ -0,0 +1,17 @@
+import asyncio
+import random
+
+async def wait_for_deployment(runtime):
+    """Poll the runtime endpoint status until it reaches a terminal state."""
+    end_status = ['READY', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_FAILED']
+    status_response = await asyncio.to_thread(runtime.status)
+    status = status_response.endpoint['status']
+    delay = 2.0
+    while status not in end_status:
+        # Exponential backoff with jitter, capped at 30s between polls
+        await asyncio.sleep(delay + random.uniform(0, 1))
+        delay = min(delay * 1.5, 30.0)
+        status_response = await asyncio.to_thread(runtime.status)
+        status = status_response.endpoint['status']
+        print(status)
+    return status
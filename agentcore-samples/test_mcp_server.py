@@ -1,12 +1,57 @@
 import asyncio
+import base64
 import boto3
+import json
+import logging
+import os
 import sys
+import time
 from datetime import timedelta
 
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
+# Configure only this script's logger; library loggers (httpx, mcp, botocore) keep their defaults
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.DEBUG if os.getenv("MCP_DEBUG") else logging.INFO)
+logger.propagate = False
+
+TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/mcp_test_token.json")
+
+def _decode_jwt_claims(token):
+    # Only used to decide cache freshness locally, so the signature is not verified
+    payload = token.split('.')[1]
+    payload += '=' * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))
+
+def _load_cached_token(client_id):
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            cached = json.load(f)
+        if cached.get('client_id') != client_id:
+            return None
+        token = cached['access_token']
+        claims = _decode_jwt_claims(token)
+        lifetime = claims['exp'] - claims.get('iat', claims['exp'])
+        # Refresh once 75% of the token lifetime has elapsed
+        if time.time() < claims['exp'] - 0.25 * lifetime:
+            return token
+    except (OSError, ValueError, KeyError, IndexError):
+        pass
+    return None
+
+def _save_cached_token(client_id, token):
+    os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+    fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'client_id': client_id, 'access_token': token}, f)
+
 def reauthenticate_user(client_id):
+    bearer_token = _load_cached_token(client_id)
+    if bearer_token:
+        return bearer_token
+
     region = "us-west-2"
     # Initialize Cognito client
     cognito_client = boto3.client('cognito-idp', region_name=region)
@@ -20,6 +65,7 @@ def reauthenticate_user(client_id):
         }
     )
     bearer_token = auth_response['AuthenticationResult']['AccessToken']
+    _save_cached_token(client_id, bearer_token)
     return bearer_token
 
 async def main():
@@ -27,7 +73,8 @@ async def main():
     region = "us-west-2"
     agent_arn = "arn:aws:bedrock-agentcore:us-west-2:XXXXXXXXXX" # copy ARN from .bedrock_agentcore.yaml
     client_id = "XXXXXXXXXX" # copy ClientId from .bedrock_agentcore.yaml (allowedClients)
-    bearer_token = reauthenticate_user(client_id)
+    # Run the blocking Cognito call off the event loop
+    bearer_token = await asyncio.to_thread(reauthenticate_user, client_id)
 
     encoded_arn = agent_arn.replace(':', '%3A').replace('/', '%2F')
     mcp_url = f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{encoded_arn}/invocations?qualifier=DEFAULT"
@@ -36,8 +83,9 @@ async def main():
         "Content-Type": "application/json"
     }
 
-    print(f"\nConnecting to: {mcp_url}")
-    print(f"\nToken: {bearer_token}")
+    # Keep the URL and token material out of the output unless MCP_DEBUG is set
+    logger.debug("Connecting to: %s", mcp_url)
+    logger.debug("Token: %s", bearer_token)
     print("Headers configured")
 
     try:
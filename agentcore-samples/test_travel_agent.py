@@ -1,9 +1,16 @@
 import boto3
 import json
+from botocore.config import Config
 
 agentcore_client = boto3.client(
     'bedrock-agentcore',
-    region_name="us-west-2"
+    region_name="us-west-2",
+    # Room for parallel invoke_agent_runtime calls when load testing
+    config=Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 3}
+    )
 )
 
 boto3_response = agentcore_client.invoke_agent_runtime(
@@ -12,13 +19,11 @@ boto3_response = agentcore_client.invoke_agent_runtime(
     payload=json.dumps({"prompt": "Can you tell me travel options to Seattle?"})
 )
 if "text/event-stream" in boto3_response.get("contentType", ""):
-    content = []
-    for line in boto3_response["response"].iter_lines(chunk_size=1):
-        if line:
-            line = line.decode("utf-8")
-            if line.startswith("data: "):
-                line = line[6:]
-                print(line)
+    data_prefix = b"data: "
+    for line in boto3_response["response"].iter_lines(chunk_size=64 * 1024):
+        # Skip keep-alive and non-data frames before decoding
+        if line.startswith(data_prefix):
+            print(line[len(data_prefix):].decode("utf-8"))
 else:
     try:
         events = []
@@ -1,5 +1,6 @@
-import boto3
+import os
 from strands import Agent, tool
+from botocore.config import Config as BotocoreConfig
 from strands.models import BedrockModel
 
 # Define a travel-focused system prompt
@@ -13,34 +14,35 @@ Provide the users with a friendly customer support response that includes availa
 
 """
 
+# Available flight carriers per destination city
+FLIGHTS = {
+    "Atlanta": ("Delta Airlines", "Spirit Airlines"),
+    "Seattle": ("Alaska Airlines", "Delta Airlines"),
+    "New York": ("United Airlines", "JetBlue"),
+}
+_FLIGHTS_BY_CITY = {city.casefold(): carriers for city, carriers in FLIGHTS.items()}
+
 @tool
-def flight_search(city: str) -> dict:
+def flight_search(city: str) -> list:
     """Get available flight options to a city.
 
     Args:
         city: The name of the city
     """
-    flights = {
-        "Atlanta": [
-            "Delta Airlines",
-            "Spirit Airlines"
-        ],
-        "Seattle": [
-            "Alaska Airlines",
-            "Delta Airlines"
-        ],
-        "New York": [
-            "United Airlines",
-            "JetBlue"
-        ]
-    }
-    return flights[city]
+    return list(_FLIGHTS_BY_CITY.get(city.strip().casefold(), ()))
 
 
 # Create a BedrockModel
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-pro-v1:0",
-    region_name="us-west-2"
+    region_name="us-west-2",
+    # Long streaming responses can exceed botocore's 60s default read timeout
+    boto_client_config=BotocoreConfig(
+        read_timeout=int(os.getenv("BEDROCK_READ_TIMEOUT", "300")),
+        connect_timeout=10,
+        retries={"max_attempts": 2, "mode": "adaptive"},
+        tcp_keepalive=True
+    )
 )
 
 travel_agent = Agent(
@@ -1,5 +1,6 @@
-import boto3
+import os
 from strands import Agent, tool
+from botocore.config import Config as BotocoreConfig
 from strands.models import BedrockModel
 
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
@@ -17,34 +18,35 @@ Provide the users with a friendly customer support response that includes availa
 
 """
 
+# Available flight carriers per destination city
+FLIGHTS = {
+    "Atlanta": ("Delta Airlines", "Spirit Airlines"),
+    "Seattle": ("Alaska Airlines", "Delta Airlines"),
+    "New York": ("United Airlines", "JetBlue"),
+}
+_FLIGHTS_BY_CITY = {city.casefold(): carriers for city, carriers in FLIGHTS.items()}
+
 @tool
-def flight_search(city: str) -> dict:
+def flight_search(city: str) -> list:
     """Get available flight options to a city.
 
     Args:
         city: The name of the city
     """
-    flights = {
-        "Atlanta": [
-            "Delta Airlines",
-            "Spirit Airlines"
-        ],
-        "Seattle": [
-            "Alaska Airlines",
-            "Delta Airlines"
-        ],
-        "New York": [
-            "United Airlines",
-            "JetBlue"
-        ]
-    }
-    return flights[city]
+    return list(_FLIGHTS_BY_CITY.get(city.strip().casefold(), ()))
 
 
 # Create a BedrockModel
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-pro-v1:0",
-    region_name="us-west-2"
+    region_name="us-west-2",
+    # Long streaming responses can exceed botocore's 60s default read timeout
+    boto_client_config=BotocoreConfig(
+        read_timeout=int(os.getenv("BEDROCK_READ_TIMEOUT", "300")),
+        connect_timeout=10,
+        retries={"max_attempts": 2, "mode": "adaptive"},
+        tcp_keepalive=True
+    )
 )
 
 travel_agent = Agent(
@@ -54,13 +56,14 @@ travel_agent = Agent(
     )
 
 @app.entrypoint
-def travel_agent_bedrock(payload):
+async def travel_agent_bedrock(payload):
     """
     Invoke the travel agent with a payload
     """
     user_input = payload.get("prompt")
     print("User input:", user_input)
-    response = travel_agent(user_input)
+    # Await the agent so concurrent invocations don't block the event loop
+    response = await travel_agent.invoke_async(user_input)
     return response.message['content'][0]['text']
 
 if __name__ == "__main__":
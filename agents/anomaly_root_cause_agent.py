@@ -2,8 +2,9 @@ from strands import Agent, tool
 from strands_tools import retrieve
 import os
 import sys
-import boto3
 import json
+import atexit
+import threading
 from strands.tools.mcp import MCPClient
 from mcp import stdio_client, StdioServerParameters
 from typing import Optional, Any
@@ -26,27 +27,8 @@ if not KB_ID:
 else:
     print(f"Using Knowledge Base ID: {KB_ID}")
     
-# Global MCP client instance
-_mcp_client = None
-_agent_instance = None
-
-def _get_mcp_client():
-    """Get or create the MCP client instance."""
-    global _mcp_client
-    if _mcp_client is None:
-        _mcp_client = MCPClient(lambda: stdio_client(
-            StdioServerParameters(
-                command="uvx", 
-                args=["awslabs.aws-iot-sitewise-mcp-server"]
-            )
-        ))
-    return _mcp_client
-
-def _get_agent_instance():
-    """Get or create the anomaly detection agent instance."""
-    global _agent_instance
-    if _agent_instance is None:
-        instructions = """
+# System prompt for Anomaly Root Cause Agent
+ANOMALY_SYSTEM_PROMPT = """
         You are an expert anomaly detection and root cause analysis agent for manufacturing equipment.
 
         Your responsibilities:
@@ -72,22 +54,70 @@ def _get_agent_instance():
         Always provide clear, actionable insights for maintenance teams. Make sure to only use data retrieved through sensors and from knowledge bases.
         Describe lack of data in your outputs, and flag this lack of data access as SEVERE OPERATION_RISK.
         """
-        
-        mcp_client = _get_mcp_client()
-        mcp_client.start()  # Start and keep the client running
-        tools = mcp_client.list_tools_sync()
-        
-        # Create model with Knowledge Base configuration
-        model = get_bedrock_model_for_agent("anomaly_root_cause")
-        
-        _agent_instance = Agent(
-            system_prompt=instructions, 
-            tools=[tools, retrieve],
-            model=model
-        )
+
+# Global MCP client instance
+_mcp_client = None
+_agent_instance = None
+_agent_lock = threading.Lock()
+
+def _get_mcp_client():
+    """Get or create the MCP client instance."""
+    global _mcp_client
+    if _mcp_client is None:
+        _mcp_client = MCPClient(lambda: stdio_client(
+            StdioServerParameters(
+                command="uvx", 
+                args=["awslabs.aws-iot-sitewise-mcp-server"]
+            )
+        ))
+    return _mcp_client
+
+def close_mcp_client():
+    """Stop the MCP client session and drop the cached agent."""
+    global _mcp_client, _agent_instance
+    if _mcp_client is not None and _agent_instance is not None:
+        _mcp_client.stop(None, None, None)
+    _mcp_client = None
+    _agent_instance = None
+
+atexit.register(close_mcp_client)
+
+def _get_agent_instance():
+    """Get or create the anomaly detection agent instance."""
+    global _mcp_client, _agent_instance
+    with _agent_lock:
+        if _agent_instance is None:
+            mcp_client = _get_mcp_client()
+            mcp_client.start()  # Start and keep the client running
+            try:
+                tools = mcp_client.list_tools_sync()  # Listed once and kept with the cached agent
+                
+                # Create model with Knowledge Base configuration
+                model = get_bedrock_model_for_agent("anomaly_root_cause")
+                
+                _agent_instance = Agent(
+                    system_prompt=ANOMALY_SYSTEM_PROMPT, 
+                    tools=[tools, retrieve],
+                    model=model
+                )
+            except Exception:
+                # No agent was cached, so close_mcp_client would skip this client; stop it here
+                mcp_client.stop(None, None, None)
+                _mcp_client = None
+                raise
     
     return _agent_instance
 
+def warm_up():
+    """Start the MCP session in a background thread so the first call doesn't wait on it."""
+    def _start():
+        try:
+            _get_agent_instance()
+        except Exception as e:
+            print(f"Anomaly agent warm-up failed, will retry on first call: {e}")
+    
+    threading.Thread(target=_start, name="anomaly-agent-warm-up", daemon=True).start()
+
 @tool
 def anomaly_root_cause_agent(
     query: str,
@@ -119,11 +149,10 @@ def anomaly_root_cause_agent(
     """
     try:
         # Build the full query
-        full_query = query
-        if asset_id:
-            full_query = f"{query} for asset id: {asset_id}"
+        parts = [f"{query} for asset id: {asset_id}" if asset_id else query]
         if context:
-            full_query = f"{full_query}. Additional context: {context}"
+            parts.append(f"Additional context: {context}")
+        full_query = ". ".join(parts)
         
         # Get the agent instance (MCP client is already started)
         agent = _get_agent_instance()
@@ -1,8 +1,15 @@
 from strands import Agent, tool
 from strands.tools.mcp import MCPClient
 from mcp import stdio_client, StdioServerParameters
-import requests
-import json
+import atexit
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import get_bedrock_model_for_agent
 
 # System prompt for Maintenance Planner Agent
 maintenance_planner_instructions = """
@@ -35,6 +42,67 @@ When creating work orders:
 Align your response analysis with actions that follow the correct SOPs. Transform technical data into practical maintenance intelligence. Always respond with the complete work order details and next steps for the maintenance team.
 """
 
+# Global MCP client instances, started once and reused across calls
+_sop_client = None
+_cmms_client = None
+_mcp_tools = None
+_mcp_lock = threading.Lock()
+
+def _get_mcp_tools():
+    """Get the SOP and CMMS tools, starting the MCP clients on first use."""
+    global _sop_client, _cmms_client, _mcp_tools
+    with _mcp_lock:
+        if _mcp_tools is None:
+            # Create MCP clients for SOP and CMMS servers using STDIO
+            _sop_client = MCPClient(lambda: stdio_client(
+                StdioServerParameters(
+                    command="uv",
+                    args=["run", "python", "mcp_servers/servers/sop_mcp_server.py", "--stdio"]
+                )
+            ))
+            _cmms_client = MCPClient(lambda: stdio_client(
+                StdioServerParameters(
+                    command="uv",
+                    args=["run", "python", "mcp_servers/servers/cmms_mcp_server.py", "--stdio"]
+                )
+            ))
+            clients = (_cmms_client, _sop_client)
+
+            # Start both servers concurrently and keep the clients running
+            started = []
+            try:
+                with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+                    futures = [executor.submit(client.start) for client in clients]
+                    started = [c for c, f in zip(clients, futures) if f.exception() is None]
+                    for future in futures:
+                        future.result()
+                    print("Connected to maintenance systems via MCP")
+
+                    # List tools once; the schemas are static for the life of the server processes
+                    tool_lists = list(executor.map(lambda client: client.list_tools_sync(), clients))
+            except Exception:
+                # Stop whichever server did come up so a retry doesn't leak its subprocess
+                for client in started:
+                    client.stop(None, None, None)
+                _sop_client = _cmms_client = None
+                raise
+            _mcp_tools = [t for tools in tool_lists for t in tools]
+        return _mcp_tools
+
+def connect_mcp_clients() -> None:
+    """Start the SOP and CMMS MCP clients ahead of the first planning call."""
+    _get_mcp_tools()
+
+def close_mcp_clients():
+    """Stop the MCP clients if they were started."""
+    global _sop_client, _cmms_client, _mcp_tools
+    for client in (_sop_client, _cmms_client):
+        if client is not None:
+            client.stop(None, None, None)
+    _sop_client = _cmms_client = _mcp_tools = None
+
+atexit.register(close_mcp_clients)
+
 @tool
 def maintenance_planner_agent(incident_report: str) -> str:
     """
@@ -48,40 +116,17 @@ def maintenance_planner_agent(incident_report: str) -> str:
     """
     # Connect to CMMS MCP server to use create_work_order tool
     try:
-       
-         # Create MCP clients for WPMS and CMMS servers using STDIO
-        from mcp.client.stdio import stdio_client, StdioServerParameters
-        
-        sop_client = MCPClient(lambda: stdio_client(
-            StdioServerParameters(
-                command="uv",
-                args=["run", "python", "mcp_servers/servers/sop_mcp_server.py", "--stdio"]
-            )
-        ))
-        cmms_client = MCPClient(lambda: stdio_client(
-            StdioServerParameters(
-                command="uv",
-                args=["run", "python", "mcp_servers/servers/cmms_mcp_server.py", "--stdio"]
-            )
-        ))
-
-        with sop_client, cmms_client:
-            print("Connected to maintenance systems via MCP")
-
-            # Get available tools from both servers
-            cmms_tools = cmms_client.list_tools_sync()
-            sop_tools = sop_client.list_tools_sync()
-            all_mcp_tools = cmms_tools + sop_tools
-            
-            print(f"Loaded {len(all_mcp_tools)} maintenance tools", "🔧")
+        all_mcp_tools = _get_mcp_tools()
+        print(f"Loaded {len(all_mcp_tools)} maintenance tools", "🔧")
 
-            agent = Agent(
-                name="Maintenance Planner",
-                system_prompt=maintenance_planner_instructions,
-                tools=[all_mcp_tools]
-            )
-        
-            return agent(incident_report)
+        agent = Agent(
+            name="Maintenance Planner",
+            system_prompt=maintenance_planner_instructions,
+            tools=[all_mcp_tools],
+            model=get_bedrock_model_for_agent("maintenance_planner")
+        )
+    
+        return agent(incident_report)
             
     except Exception as e:
         # Fallback to mock response for testing
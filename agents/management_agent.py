@@ -5,10 +5,7 @@ from bedrock_agentcore.runtime import (
 )  #### AGENTCORE RUNTIME - LINE 1 ####
 from strands import Agent
 from strands.tools.mcp import MCPClient
-from mcp.client.streamable_http import streamablehttp_client
-import requests
 import boto3
-from strands.models import BedrockModel
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import get_bedrock_model_for_agent
@@ -61,12 +58,12 @@ async def invoke(payload, context=None):
     ))
 
     agent = Agent(
-        model='us.anthropic.claude-sonnet-4-20250514-v1:0',
+        model=get_bedrock_model_for_agent("management"),
         system_prompt=SYSTEM_PROMPT,
         tools=[erp_client, mes_client, logistic_client]
     )
-    # Invoke the agent
-    response = agent(user_input)
+    # Invoke the agent without blocking the event loop
+    response = await agent.invoke_async(user_input)
     return response.message["content"][0]["text"]
 
 
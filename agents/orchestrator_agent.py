@@ -1,18 +1,54 @@
-from strands import Agent
+from strands import Agent, tool
+import asyncio
 import sys
 import os
 
 # Add the agents directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the agents directly
-from anomaly_root_cause_agent import anomaly_root_cause_agent
-from maintenance_planner_agent import maintenance_planner_agent
+from anomaly_root_cause_agent import anomaly_root_cause_agent, warm_up as warm_up_anomaly_agent
+from maintenance_planner_agent import maintenance_planner_agent, connect_mcp_clients
+from config import config, get_bedrock_model_for_agent
 
 # Asset ID to analyze - Remember to >> export IOT_SITEWISE_ASSET_ID="<GearboxPressAssetId>"
 asset_id = os.getenv("IOT_SITEWISE_ASSET_ID")
 print(f"Using IoT Sitewise Asset ID: {asset_id}")
 
+@tool
+async def analyze_and_plan(asset_id: str, context: str = "") -> str:
+    """
+    Analyze an asset for anomalies and create a maintenance work order in one step.
+    
+    The maintenance systems are connected while the anomaly analysis runs, so only
+    the work order creation waits on the analysis result.
+    
+    Args:
+        asset_id: AWS IoT SiteWise asset ID to analyze
+        context: Additional context about the equipment or situation
+        
+    Returns:
+        The anomaly analysis followed by the maintenance plan
+    """
+    analysis, _ = await asyncio.gather(
+        asyncio.to_thread(
+            anomaly_root_cause_agent,
+            query="Detect anomaly and analyze root cause if any",
+            asset_id=asset_id,
+            context=context
+        ),
+        # Connection errors are handled again by the planner itself
+        asyncio.to_thread(connect_mcp_clients),
+        return_exceptions=True
+    )
+    if isinstance(analysis, Exception):
+        return f"Anomaly detection error: {analysis}"
+    
+    plan = await asyncio.to_thread(maintenance_planner_agent, str(analysis))
+    return f"ANOMALY ANALYSIS:\n{analysis}\n\nMAINTENANCE PLAN:\n{plan}"
+
 # System prompt for orchestrator
 orchestrator_instructions = """
 You are a Manufacturing Operations Supervisor that orchestrates between the Anomaly Root Cause Agent and the Maintenance Planner Agent.
@@ -22,6 +58,9 @@ Your main workflow:
 2. If an anomaly is detected, pass the analysis results to the maintenance_planner agent to create a work order and reaction plan
 3. Provide a summary of the entire process and outcomes
 
+When the request asks for both an analysis and a work order, you may instead call the analyze_and_plan tool,
+which runs both steps with the maintenance systems connected in parallel.
+
 Always ensure both agents complete their tasks and provide comprehensive results.
 """
 
@@ -29,10 +68,17 @@ Always ensure both agents complete their tasks and provide comprehensive results
 orchestrator = Agent(
     name="Orchestrator",
     system_prompt=orchestrator_instructions,
-    tools=[anomaly_root_cause_agent, maintenance_planner_agent]
+    tools=[anomaly_root_cause_agent, maintenance_planner_agent, analyze_and_plan],
+    model=get_bedrock_model_for_agent("orchestrator")
 )
 
 if __name__ == "__main__":
+    # Build the sub-agent models now rather than inside their first tool call
+    config.prebuild_agents(["anomaly_root_cause", "maintenance_planner"])
+    
+    # Start the SiteWise MCP session while the orchestrator plans its first step
+    warm_up_anomaly_agent()
+    
     # Run the orchestration
     query = f"""
     Coordinate the following workflow:
@@ -1,6 +1,8 @@
 import os
+import threading
 import boto3
-from typing import Optional
+from botocore.config import Config as BotocoreConfig
+from typing import Dict, Iterable, Optional, Tuple
 from dotenv import load_dotenv
 from strands import models
 
@@ -10,34 +12,88 @@ load_dotenv()
 class Config:
     """Simple configuration management for Strands agents"""
     
+    def __init__(self):
+        self._boto_sessions: Dict[Tuple[str, Optional[str]], boto3.Session] = {}
+        self._session_lock = threading.Lock()
+        self.refresh()
+    
+    def refresh(self):
+        """Re-read settings from environment variables and drop cached per-agent values and models"""
+        self._aws_region = os.getenv('AWS_REGION', 'us-east-1')
+        self._aws_profile = os.getenv('AWS_PROFILE')
+        self._model_id = os.getenv('MODEL_ID', 'us.anthropic.claude-sonnet-4-20250514-v1:0')
+        self._reasoning_enabled = os.getenv('REASONING_ENABLED', 'false').lower() == 'true'
+        self._bedrock_read_timeout = int(os.getenv('BEDROCK_READ_TIMEOUT', '300'))
+        self._bedrock_connect_timeout = int(os.getenv('BEDROCK_CONNECT_TIMEOUT', '10'))
+        self._bedrock_max_attempts = int(os.getenv('BEDROCK_MAX_ATTEMPTS', '2'))
+        self._agent_model_ids: Dict[str, str] = {}
+        self._agent_reasoning_enabled: Dict[str, bool] = {}
+        self._agent_models: Dict[Tuple[str, Optional[str], Optional[bool]], models.BedrockModel] = {}
+    
     @property
     def aws_region(self) -> str:
         """Get AWS region from environment variables"""
-        return os.getenv('AWS_REGION', 'us-east-1')
+        return self._aws_region
     
     @property 
     def aws_profile(self) -> Optional[str]:
         """Get AWS profile from environment variables"""
-        return os.getenv('AWS_PROFILE')
+        return self._aws_profile
     
     @property
     def model_id(self) -> str:
         """Get model ID from environment variables"""
-        return os.getenv('MODEL_ID', 'us.anthropic.claude-sonnet-4-20250514-v1:0')
+        return self._model_id
     
     @property
     def reasoning_enabled(self) -> bool:
         """Get reasoning setting from environment variables"""
-        return os.getenv('REASONING_ENABLED', 'false').lower() == 'true'
+        return self._reasoning_enabled
+    
+    @property
+    def bedrock_read_timeout(self) -> int:
+        """Get Bedrock read timeout in seconds from environment variables"""
+        return self._bedrock_read_timeout
+    
+    @property
+    def bedrock_connect_timeout(self) -> int:
+        """Get Bedrock connect timeout in seconds from environment variables"""
+        return self._bedrock_connect_timeout
+    
+    @property
+    def bedrock_max_attempts(self) -> int:
+        """Get Bedrock max call attempts (including the first) from environment variables"""
+        return self._bedrock_max_attempts
+    
+    def get_bedrock_client_config(self) -> BotocoreConfig:
+        """Create botocore config sized for long Bedrock streaming responses"""
+        return BotocoreConfig(
+            read_timeout=self.bedrock_read_timeout,
+            connect_timeout=self.bedrock_connect_timeout,
+            retries={'max_attempts': self.bedrock_max_attempts, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
     
     def get_boto_session(self) -> boto3.Session:
-        """Create configured boto3 session"""
-        session_kwargs = {'region_name': self.aws_region}
+        """Get the configured boto3 session, shared by all agents in the process.
         
-        if self.aws_profile:
-            session_kwargs['profile_name'] = self.aws_profile
-            
-        return boto3.Session(**session_kwargs)
+        One session is kept per (region, profile) pair so credential resolution and
+        botocore loader setup happen once. Sessions are safe to share across threads
+        for creating clients; creation itself is guarded by a lock.
+        """
+        key = (self.aws_region, self.aws_profile)
+        session = self._boto_sessions.get(key)
+        if session is None:
+            with self._session_lock:
+                session = self._boto_sessions.get(key)
+                if session is None:
+                    session_kwargs = {'region_name': self.aws_region}
+                    
+                    if self.aws_profile:
+                        session_kwargs['profile_name'] = self.aws_profile
+                        
+                    session = self._boto_sessions[key] = boto3.Session(**session_kwargs)
+        return session
     
     def create_bedrock_model(self, model_id: Optional[str] = None, reasoning: Optional[bool] = None) -> models.BedrockModel:
         """Create a configured BedrockModel instance"""
@@ -47,18 +103,26 @@ class Config:
         
         return models.BedrockModel(
             model_id=model_id,
-            boto_session=boto_session
+            boto_session=boto_session,
+            boto_client_config=self.get_bedrock_client_config()
         )
     
     def get_agent_model_id(self, agent_name: str) -> str:
         """Get model ID for specific agent, falling back to global default"""
-        agent_key = f"{agent_name.upper()}_AGENT_MODEL_ID"
-        return os.getenv(agent_key, self.model_id)
+        model_id = self._agent_model_ids.get(agent_name)
+        if model_id is None:
+            agent_key = f"{agent_name.upper()}_AGENT_MODEL_ID"
+            model_id = self._agent_model_ids[agent_name] = os.getenv(agent_key, self.model_id)
+        return model_id
     
     def get_agent_reasoning_enabled(self, agent_name: str) -> bool:
         """Get reasoning setting for specific agent, falling back to global default"""
-        agent_key = f"{agent_name.upper()}_AGENT_REASONING_ENABLED"
-        return os.getenv(agent_key, str(self.reasoning_enabled)).lower() == 'true'
+        reasoning = self._agent_reasoning_enabled.get(agent_name)
+        if reasoning is None:
+            agent_key = f"{agent_name.upper()}_AGENT_REASONING_ENABLED"
+            reasoning = os.getenv(agent_key, str(self.reasoning_enabled)).lower() == 'true'
+            self._agent_reasoning_enabled[agent_name] = reasoning
+        return reasoning
     
     def create_bedrock_model_for_agent(self, agent_name: str, model_id: Optional[str] = None, reasoning: Optional[bool] = None) -> models.BedrockModel:
         """Create a configured BedrockModel instance for specific agent"""
@@ -68,10 +132,23 @@ class Config:
             reasoning = self.get_agent_reasoning_enabled(agent_name)
         
         return self.create_bedrock_model(model_id=model_id, reasoning=reasoning)
+    
+    def get_bedrock_model_for_agent(self, agent_name: str, model_id: Optional[str] = None, reasoning: Optional[bool] = None) -> models.BedrockModel:
+        """Get the shared BedrockModel for specific agent, building it on first use"""
+        key = (agent_name, model_id, reasoning)
+        model = self._agent_models.get(key)
+        if model is None:
+            model = self._agent_models[key] = self.create_bedrock_model_for_agent(agent_name, model_id=model_id, reasoning=reasoning)
+        return model
+    
+    def prebuild_agents(self, agent_names: Iterable[str]):
+        """Build the default models for the given agents at startup, off the request path"""
+        for agent_name in agent_names:
+            self.get_bedrock_model_for_agent(agent_name)
 
 # Global configuration instance
 config = Config()
 
 def get_bedrock_model_for_agent(agent_name: str, model_id: Optional[str] = None, reasoning: Optional[bool] = None) -> models.BedrockModel:
     """Convenience function to get a configured model for specific agent"""
-    return config.create_bedrock_model_for_agent(agent_name=agent_name, model_id=model_id, reasoning=reasoning)
+    return config.get_bedrock_model_for_agent(agent_name=agent_name, model_id=model_id, reasoning=reasoning)
@@ -3,11 +3,15 @@ CMMS (Computerized Maintenance Management System) MCP Server
 Provides maintenance-related tools using local JSON data.
 """
 from fastmcp import FastMCP
+from starlette.responses import JSONResponse, Response
 import datetime
-import uuid
+import functools
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Union
 from json_data_loader import data_loader
+from server_utils import make_id_suffix_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -16,6 +20,10 @@ logger = logging.getLogger('CMMS-Server')
 # Initialize FastMCP
 mcp = FastMCP("CMMS Server 🔧")
 
+# Server start time for reporting; uptime is measured on the monotonic clock
+STARTED_AT = datetime.datetime.now()
+STARTED_MONOTONIC = time.monotonic()
+
 # Server metadata
 SERVER_INFO = {
     "name": "CMMS Server",
@@ -23,7 +31,7 @@ SERVER_INFO = {
     "description": "Computerized Maintenance Management System - Wind Turbine Assembly Plant",
     "port": 8001,
     "status": "running",
-    "started_at": datetime.datetime.now().isoformat(),
+    "started_at": STARTED_AT.isoformat(),
     "data_source": "local_json_files"
 }
 
@@ -31,19 +39,17 @@ SERVER_INFO = {
 async def health_check(request):
     """Health check endpoint."""
     try:
-        from starlette.responses import JSONResponse
-        
         # Test data loading
         cmms_data = data_loader.get_cmms_data()
         data_status = "healthy" if cmms_data.get("data") else "unhealthy"
         
         health_data = {
             "status": data_status,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "server": "CMMS",
             "port": 8001,
             "data_source": "local_json_files",
-            "uptime_seconds": (datetime.datetime.now() - datetime.datetime.fromisoformat(SERVER_INFO["started_at"])).total_seconds()
+            "uptime_seconds": time.monotonic() - STARTED_MONOTONIC
         }
         
         return JSONResponse(content=health_data, status_code=200 if data_status == "healthy" else 503)
@@ -51,32 +57,51 @@ async def health_check(request):
         logger.error(f"Health check error: {e}")
         return JSONResponse(content={"status": "error", "message": str(e)}, status_code=500)
 
+# SERVER_INFO is static after startup, so serialize it once (same encoding as JSONResponse)
+SERVER_INFO_BYTES = json.dumps(SERVER_INFO, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
 @mcp.custom_route("/info", methods=["GET"])
 async def server_info(request):
     """Server information endpoint."""
-    from starlette.responses import JSONResponse
-    return JSONResponse(content=SERVER_INFO)
+    return Response(content=SERVER_INFO_BYTES, media_type="application/json")
+
+# Last formatted second; tool responses only need second resolution
+_last_sec, _last_iso = 0, ""
+
+def _now_iso() -> str:
+    """Current local time as ISO-8601, reformatted at most once per second."""
+    global _last_sec, _last_iso
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_sec, _last_iso = sec, datetime.datetime.fromtimestamp(sec).isoformat()
+    return _last_iso
+
+# Random work order ID suffixes, drawn from the CSPRNG in batches rather than per order
+ID_SUFFIX_LENGTH = 6
+ID_POOL_SIZE = 1024
+_next_id_suffix = make_id_suffix_pool(ID_SUFFIX_LENGTH, ID_POOL_SIZE)
 
 def handle_errors(func):
     """Error handling decorator."""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"Tool {func.__name__} executed successfully")
+            logger.debug("Tool %s executed successfully", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"Error in tool {func.__name__}: {e}")
+            logger.error("Error in tool %s: %s", func.__name__, e)
             return {
                 "success": False,
                 "error": str(e),
                 "tool": func.__name__,
-                "timestamp": datetime.datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     return wrapper
 
-@handle_errors
 @mcp.tool
-def get_work_orders(machine_id: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+@handle_errors
+def get_work_orders(machine_id: Optional[str] = None, status: Optional[str] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Get work orders, optionally filtered by machine ID and/or status.
     
@@ -89,20 +114,20 @@ def get_work_orders(machine_id: Optional[str] = None, status: Optional[str] = No
     """
     logger.info(f"Getting work orders - machine_id: {machine_id}, status: {status}")
     
-    cmms_data = data_loader.get_cmms_data()
-    work_orders = cmms_data.get("data", {}).get("work_orders", [])
-    
-    # Apply filters
-    filtered_orders = work_orders
-    if machine_id:
-        filtered_orders = [wo for wo in filtered_orders if wo.get("machine_id") == machine_id]
-    if status:
-        filtered_orders = [wo for wo in filtered_orders if wo.get("status") == status.upper()]
+    # Apply filters using the pre-built indexes
+    if machine_id and status:
+        filtered_orders = data_loader.get_cmms_index("work_orders", ("machine_id", "status")).get((machine_id, status.upper()), [])
+    elif machine_id:
+        filtered_orders = data_loader.get_cmms_index("work_orders", "machine_id").get(machine_id, [])
+    elif status:
+        filtered_orders = data_loader.get_cmms_index("work_orders", "status").get(status.upper(), [])
+    else:
+        filtered_orders = data_loader.get_cmms_section("work_orders")
     
     return filtered_orders
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def create_work_order(machine_id: str, description: str, priority: str = "MEDIUM") -> Dict[str, Any]:
     """
     Create a new work order for a machine.
@@ -126,14 +151,15 @@ def create_work_order(machine_id: str, description: str, priority: str = "MEDIUM
         }
     
     # Generate work order ID
-    workorder_id = f"WO-{datetime.datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:6]}"
+    now_iso = _now_iso()
+    workorder_id = f"WO-{now_iso[:10].replace('-', '')}-{_next_id_suffix()}"
     
     work_order = {
         "workorder_id": workorder_id,
         "machine_id": machine_id,
         "machine_name": machine.get("name", "Unknown"),
         "description": description,
-        "date": datetime.datetime.now().isoformat(),
+        "date": now_iso,
         "status": "OPEN",
         "priority": priority.upper(),
         "resolution_comments": None,
@@ -150,8 +176,8 @@ def create_work_order(machine_id: str, description: str, priority: str = "MEDIUM
         "message": f"Work order {workorder_id} created successfully"
     }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_maintenance_history(machine_id: str) -> Dict[str, Any]:
     """
     Get maintenance history for a specific machine.
@@ -172,16 +198,11 @@ def get_maintenance_history(machine_id: str) -> Dict[str, Any]:
             "error": f"Machine with ID {machine_id} not found"
         }
     
-    # Get maintenance data
-    cmms_data = data_loader.get_cmms_data()
-    maintenance_history = cmms_data.get("data", {}).get("maintenance_history", [])
-    
-    # Filter history for this machine
-    machine_history = [h for h in maintenance_history if h.get("machine_id") == machine_id]
+    # Get maintenance history for this machine
+    machine_history = data_loader.get_cmms_index("maintenance_history", "machine_id").get(machine_id, [])
     
     # Get work orders for this machine
-    work_orders = [wo for wo in cmms_data.get("data", {}).get("work_orders", []) 
-                   if wo.get("machine_id") == machine_id]
+    work_orders = data_loader.get_cmms_index("work_orders", "machine_id").get(machine_id, [])
     
     return {
         "success": True,
@@ -192,8 +213,8 @@ def get_maintenance_history(machine_id: str) -> Dict[str, Any]:
         "total_work_orders": len(work_orders)
     }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_maintenance_schedules(machine_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Get maintenance schedules, optionally for a specific machine.
@@ -206,12 +227,9 @@ def get_maintenance_schedules(machine_id: Optional[str] = None) -> Dict[str, Any
     """
     logger.info(f"Getting maintenance schedules for machine: {machine_id}")
     
-    cmms_data = data_loader.get_cmms_data()
-    schedules = cmms_data.get("data", {}).get("maintenance_schedules", [])
-    
     if machine_id:
-        # Filter schedules for specific machine
-        machine_schedules = [s for s in schedules if s.get("machine_id") == machine_id]
+        # Look up schedules for specific machine
+        machine_schedules = data_loader.get_cmms_index("maintenance_schedules", "machine_id").get(machine_id, [])
         return {
             "success": True,
             "maintenance_schedules": machine_schedules,
@@ -219,14 +237,15 @@ def get_maintenance_schedules(machine_id: Optional[str] = None) -> Dict[str, Any
         }
     else:
         # Return all schedules
+        schedules = data_loader.get_cmms_section("maintenance_schedules")
         return {
             "success": True,
             "maintenance_schedules": schedules,
             "total_schedules": len(schedules)
         }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_spare_parts_usage(machine_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Get spare parts usage history, optionally for a specific machine.
@@ -239,12 +258,9 @@ def get_spare_parts_usage(machine_id: Optional[str] = None) -> Dict[str, Any]:
     """
     logger.info(f"Getting spare parts usage for machine: {machine_id}")
     
-    cmms_data = data_loader.get_cmms_data()
-    spare_parts_usage = cmms_data.get("data", {}).get("spare_parts_usage", [])
-    
     if machine_id:
-        # Filter usage for specific machine
-        machine_usage = [u for u in spare_parts_usage if u.get("machine_id") == machine_id]
+        # Look up usage for specific machine
+        machine_usage = data_loader.get_cmms_index("spare_parts_usage", "machine_id").get(machine_id, [])
         return {
             "success": True,
             "spare_parts_usage": machine_usage,
@@ -253,14 +269,15 @@ def get_spare_parts_usage(machine_id: Optional[str] = None) -> Dict[str, Any]:
         }
     else:
         # Return all usage
+        spare_parts_usage = data_loader.get_cmms_section("spare_parts_usage")
         return {
             "success": True,
             "spare_parts_usage": spare_parts_usage,
             "total_usage_events": len(spare_parts_usage)
         }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_maintenance_metrics() -> Dict[str, Any]:
     """
     Get overall maintenance metrics and KPIs.
@@ -270,18 +287,17 @@ def get_maintenance_metrics() -> Dict[str, Any]:
     """
     logger.info("Getting maintenance metrics")
     
-    cmms_data = data_loader.get_cmms_data()
-    metrics = cmms_data.get("data", {}).get("maintenance_metrics", {})
+    metrics = data_loader.get_cmms_section("maintenance_metrics") or {}
     
     return {
         "success": True,
         "maintenance_metrics": metrics,
-        "timestamp": datetime.datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
-@handle_errors
 @mcp.tool
-def get_machines() -> List[Dict[str, Any]]:
+@handle_errors
+def get_machines() -> Dict[str, Any]:
     """
     Get all machines in the system.
     
@@ -290,12 +306,7 @@ def get_machines() -> List[Dict[str, Any]]:
     """
     logger.info("Getting all machines")
     
-    machines = data_loader.get_machines()
-    return {
-        "success": True,
-        "machines": machines,
-        "total_machines": len(machines)
-    }
+    return data_loader.get_machines_response()
 
 if __name__ == "__main__":
     import sys
@@ -3,11 +3,15 @@ ERP (Enterprise Resource Planning) MCP Server
 Provides business and financial tools using local JSON data.
 """
 from fastmcp import FastMCP
+from starlette.responses import JSONResponse, Response
 import datetime
-import uuid
+import functools
+import json
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from json_data_loader import data_loader
+from server_utils import make_id_suffix_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -16,6 +20,10 @@ logger = logging.getLogger('ERP-Server')
 # Initialize FastMCP
 mcp = FastMCP("ERP Server 💼")
 
+# Server start time for reporting; uptime is measured on the monotonic clock
+STARTED_AT = datetime.datetime.now()
+STARTED_MONOTONIC = time.monotonic()
+
 # Server metadata
 SERVER_INFO = {
     "name": "ERP Server",
@@ -23,7 +31,7 @@ SERVER_INFO = {
     "description": "PN2 - ERP Cloth Production Facilites Business Data",
     "port": 8002,
     "status": "running",
-    "started_at": datetime.datetime.now().isoformat(),
+    "started_at": STARTED_AT.isoformat(),
     "data_source": "local_json_files"
 }
 
@@ -31,19 +39,17 @@ SERVER_INFO = {
 async def health_check(request):
     """Health check endpoint."""
     try:
-        from starlette.responses import JSONResponse
-        
         # Test data loading
         erp_data = data_loader.get_erp_data()
         data_status = "healthy" if erp_data.get("data") else "unhealthy"
         
         health_data = {
             "status": data_status,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "server": "ERP",
             "port": 8002,
             "data_source": "local_json_files",
-            "uptime_seconds": (datetime.datetime.now() - datetime.datetime.fromisoformat(SERVER_INFO["started_at"])).total_seconds()
+            "uptime_seconds": time.monotonic() - STARTED_MONOTONIC
         }
         
         return JSONResponse(content=health_data, status_code=200 if data_status == "healthy" else 503)
@@ -51,31 +57,50 @@ async def health_check(request):
         logger.error(f"Health check error: {e}")
         return JSONResponse(content={"status": "error", "message": str(e)}, status_code=500)
 
+# SERVER_INFO is static after startup, so serialize it once (same encoding as JSONResponse)
+SERVER_INFO_BYTES = json.dumps(SERVER_INFO, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
 @mcp.custom_route("/info", methods=["GET"])
 async def server_info(request):
     """Server information endpoint."""
-    from starlette.responses import JSONResponse
-    return JSONResponse(content=SERVER_INFO)
+    return Response(content=SERVER_INFO_BYTES, media_type="application/json")
+
+# Last formatted second; tool responses only need second resolution
+_last_sec, _last_iso = 0, ""
+
+def _now_iso() -> str:
+    """Current local time as ISO-8601, reformatted at most once per second."""
+    global _last_sec, _last_iso
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_sec, _last_iso = sec, datetime.datetime.fromtimestamp(sec).isoformat()
+    return _last_iso
+
+# Random sales order ID suffixes, drawn from the CSPRNG in batches rather than per order
+ID_SUFFIX_LENGTH = 3
+ID_POOL_SIZE = 1024
+_next_id_suffix = make_id_suffix_pool(ID_SUFFIX_LENGTH, ID_POOL_SIZE, upper=True)
 
 def handle_errors(func):
     """Error handling decorator."""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"Tool {func.__name__} executed successfully")
+            logger.debug("Tool %s executed successfully", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"Error in tool {func.__name__}: {e}")
+            logger.error("Error in tool %s: %s", func.__name__, e)
             return {
                 "success": False,
                 "error": str(e),
                 "tool": func.__name__,
-                "timestamp": datetime.datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     return wrapper
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_customers(customer_type: Optional[str] = None) -> Dict[str, Any]:
     """
     Get customer information, optionally filtered by customer type.
@@ -88,20 +113,18 @@ def get_customers(customer_type: Optional[str] = None) -> Dict[str, Any]:
     """
     logger.info(f"Getting customers - type: {customer_type}")
     
-    erp_data = data_loader.get_erp_data()
-    customers = erp_data.get("data", {}).get("customers", [])
-    
-    if customer_type:
-        customers = [c for c in customers if c.get("customer_type") == customer_type.lower()]
+    if not customer_type:
+        return data_loader.get_customers_response()
     
+    customers = data_loader.get_erp_index("customers", "customer_type").get(customer_type.lower(), [])
     return {
         "success": True,
         "customers": customers,
         "total_customers": len(customers)
     }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_sales_orders(customer_id: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
     """
     Get sales orders, optionally filtered by customer ID and/or status.
@@ -115,15 +138,15 @@ def get_sales_orders(customer_id: Optional[str] = None, status: Optional[str] =
     """
     logger.info(f"Getting sales orders - customer_id: {customer_id}, status: {status}")
     
-    erp_data = data_loader.get_erp_data()
-    sales_orders = erp_data.get("data", {}).get("sales_orders", [])
-    
-    # Apply filters
-    filtered_orders = sales_orders
-    if customer_id:
-        filtered_orders = [so for so in filtered_orders if so.get("customer_id") == customer_id]
-    if status:
-        filtered_orders = [so for so in filtered_orders if so.get("status") == status.lower()]
+    # Apply filters using the pre-built indexes
+    if customer_id and status:
+        filtered_orders = data_loader.get_erp_index("sales_orders", ("customer_id", "status")).get((customer_id, status.lower()), [])
+    elif customer_id:
+        filtered_orders = data_loader.get_erp_index("sales_orders", "customer_id").get(customer_id, [])
+    elif status:
+        filtered_orders = data_loader.get_erp_index("sales_orders", "status").get(status.lower(), [])
+    else:
+        filtered_orders = data_loader.get_erp_section("sales_orders")
     
     return {
         "success": True,
@@ -131,8 +154,8 @@ def get_sales_orders(customer_id: Optional[str] = None, status: Optional[str] =
         "total_orders": len(filtered_orders)
     }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def create_sales_order(customer_id: str, product_id: str, quantity: int) -> Dict[str, Any]:
     """
     Create a new sales order.
@@ -149,9 +172,7 @@ def create_sales_order(customer_id: str, product_id: str, quantity: int) -> Dict
     logger.info(f"Creating sales order - customer: {customer_id}, product: {product_id}, qty: {quantity}")
     
     # Validate customer exists
-    erp_data = data_loader.get_erp_data()
-    customers = erp_data.get("data", {}).get("customers", [])
-    customer = next((c for c in customers if c.get("customer_id") == customer_id), None)
+    customer = data_loader.get_customer_by_id(customer_id)
     if not customer:
         return {
             "success": False,
@@ -159,8 +180,7 @@ def create_sales_order(customer_id: str, product_id: str, quantity: int) -> Dict
         }
     
     # Validate product exists
-    products = data_loader.get_products()
-    product = next((p for p in products if p.get("id") == product_id), None)
+    product = data_loader.get_product_by_id(product_id)
     if not product:
         return {
             "success": False,
@@ -168,7 +188,7 @@ def create_sales_order(customer_id: str, product_id: str, quantity: int) -> Dict
         }
     
     # Generate order ID
-    order_id = f"SO-{datetime.datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:3].upper()}"
+    order_id = f"SO-{_now_iso()[:10].replace('-', '')}-{_next_id_suffix()}"
     
     sales_order = {
         "order_id": order_id,
@@ -183,8 +203,8 @@ def create_sales_order(customer_id: str, product_id: str, quantity: int) -> Dict
         "message": f"Sales order {order_id} created successfully"
     }
 
-@handle_errors
 @mcp.tool
+@handle_errors
 def get_products() -> Dict[str, Any]:
     """
     Get all products in the system.
@@ -194,12 +214,7 @@ def get_products() -> Dict[str, Any]:
     """
     logger.info("Getting all products")
     
-    products = data_loader.get_products()
-    return {
-        "success": True,
-        "products": products,
-        "total_products": len(products)
-    }
+    return data_loader.get_products_response()
 
 if __name__ == "__main__":
     import sys
@@ -3,14 +3,27 @@ Shared utility for loading JSON data from local manufacturing data files.
 """
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
+from types import MappingProxyType
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallbacks for missing data, so lookups never allocate defaults
+_EMPTY = ()
+_NO_DATA = MappingProxyType({})
+
 class JSONDataLoader:
     """Utility class for loading manufacturing data from JSON files."""
     
+    FACTORY_MODEL_FILE = "erp/business_data.json"
+    
     def __init__(self, base_path: str = None):
         """Initialize with base path to manufacturing data."""
         if base_path is None:
@@ -21,6 +34,11 @@ class JSONDataLoader:
         
         self.base_path = base_path
         self._cache = {}
+        self._mtimes = {}
+        self._index_cache = {}
+        # Bumped whenever cached data is dropped, so memoized tool responses rebuild
+        self._version = 0
+        self._response_cache = {}
     
     def _load_json_file(self, file_path: str) -> Dict[str, Any]:
         """Load and cache JSON file."""
@@ -29,9 +47,11 @@ class JSONDataLoader:
         
         full_path = os.path.join(self.base_path, file_path)
         try:
-            with open(full_path, 'r') as f:
-                data = json.load(f)
+            # Both parsers take bytes, so skip the text decode layer
+            with open(full_path, 'rb') as f:
+                data = _loads(f.read())
                 self._cache[file_path] = data
+                self._mtimes[file_path] = os.path.getmtime(full_path)
                 logger.debug(f"Loaded JSON data from {full_path}")
                 return data
         except FileNotFoundError:
@@ -41,9 +61,72 @@ class JSONDataLoader:
             logger.error(f"Invalid JSON in file {full_path}: {e}")
             return {"data": {}}
     
+    def _get_section(self, file_path: str, name: str) -> Any:
+        """Get a section of a file's "data" object, or an empty tuple if it is missing."""
+        return self._load_json_file(file_path).get("data", _NO_DATA).get(name, _EMPTY)
+    
+    def _get_index(self, file_path: str, section: str, key: Union[str, Tuple[str, ...]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Get records of a data section grouped by a field, built in one pass on first access.
+        
+        A tuple of fields builds a composite index keyed by the tuple of their values,
+        so combined filters are a single lookup.
+        """
+        cache_key = (file_path, section, key)
+        index = self._index_cache.get(cache_key)
+        if index is None:
+            index = {}
+            records = self._get_section(file_path, section)
+            if isinstance(key, tuple):
+                for record in records:
+                    index.setdefault(tuple(record.get(k) for k in key), []).append(record)
+            else:
+                for record in records:
+                    index.setdefault(record.get(key), []).append(record)
+            self._index_cache[cache_key] = index
+        return index
+    
+    def _get_lookup(self, file_path: str, section: str, key: str) -> Dict[Any, Dict[str, Any]]:
+        """Get a map from a unique field to its record, keeping the first record per value."""
+        cache_key = (file_path, section, key, "unique")
+        lookup = self._index_cache.get(cache_key)
+        if lookup is None:
+            lookup = {}
+            records = self._get_section(file_path, section)
+            for record in records:
+                lookup.setdefault(record.get(key), record)
+            self._index_cache[cache_key] = lookup
+        return lookup
+    
+    def _get_section_response(self, file_path: str, section: str, total_key: str) -> Dict[str, Any]:
+        """Get a memoized {"success", section, total} tool response for a whole data section."""
+        cache_key = (file_path, section, total_key)
+        cached = self._response_cache.get(cache_key)
+        if cached is None or cached[0] != self._version:
+            records = self._get_section(file_path, section)
+            response = {"success": True, section: records, total_key: len(records)}
+            cached = self._response_cache[cache_key] = (self._version, response)
+        return cached[1]
+    
+    def invalidate(self, file_path: Optional[str] = None):
+        """Drop cached data and indexes for files modified on disk since they were loaded."""
+        file_paths = [file_path] if file_path else list(self._cache)
+        for path in file_paths:
+            try:
+                modified = os.path.getmtime(os.path.join(self.base_path, path)) != self._mtimes.get(path)
+            except OSError:
+                modified = True
+            if modified:
+                self._cache.pop(path, None)
+                self._mtimes.pop(path, None)
+                for cache_key in [k for k in self._index_cache if k[0] == path]:
+                    del self._index_cache[cache_key]
+                self._version += 1
+                logger.debug("Invalidated cached JSON data for %s", path)
+    
     def get_factory_model(self) -> Dict[str, Any]:
         """Get shared factory model data."""
-        return self._load_json_file("erp/business_data.json")
+        return self._load_json_file(self.FACTORY_MODEL_FILE)
     
     def get_cmms_data(self) -> Dict[str, Any]:
         """Get CMMS maintenance data."""
@@ -61,32 +144,88 @@ class JSONDataLoader:
         """Get WPMS workforce data."""
         return self._load_json_file("wpms/workforce_data.json")
     
+    def get_cmms_section(self, name: str) -> Any:
+        """Get a CMMS data section."""
+        return self._get_section("cmms/maintenance_data.json", name)
+    
+    def get_erp_section(self, name: str) -> Any:
+        """Get an ERP data section."""
+        return self._get_section("erp/business_data.json", name)
+    
+    def get_mes_section(self, name: str) -> Any:
+        """Get a MES data section."""
+        return self._get_section("mes/production_data.json", name)
+    
+    def get_wpms_section(self, name: str) -> Any:
+        """Get a WPMS data section."""
+        return self._get_section("wpms/workforce_data.json", name)
+    
+    def get_cmms_index(self, section: str, key: Union[str, Tuple[str, ...]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Get CMMS records of a section grouped by the given field."""
+        return self._get_index("cmms/maintenance_data.json", section, key)
+    
+    def get_erp_index(self, section: str, key: Union[str, Tuple[str, ...]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Get ERP records of a section grouped by the given field."""
+        return self._get_index("erp/business_data.json", section, key)
+    
+    def get_mes_index(self, section: str, key: Union[str, Tuple[str, ...]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Get MES records of a section grouped by the given field."""
+        return self._get_index("mes/production_data.json", section, key)
+    
+    def get_wpms_index(self, section: str, key: Union[str, Tuple[str, ...]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Get WPMS records of a section grouped by the given field."""
+        return self._get_index("wpms/workforce_data.json", section, key)
+    
+    def get_wpms_lookup(self, section: str, key: str) -> Dict[Any, Dict[str, Any]]:
+        """Get WPMS records of a section keyed by a unique field."""
+        return self._get_lookup("wpms/workforce_data.json", section, key)
+    
     def clear_cache(self):
         """Clear the data cache to force reload."""
         self._cache.clear()
+        self._mtimes.clear()
+        self._index_cache.clear()
+        self._version += 1
     
     def get_machines(self) -> List[Dict[str, Any]]:
         """Get all machines from factory model."""
-        factory_data = self.get_factory_model()
-        return factory_data.get("data", {}).get("machines", [])
+        return self._get_section(self.FACTORY_MODEL_FILE, "machines")
     
     def get_machine_by_id(self, machine_id: str) -> Optional[Dict[str, Any]]:
         """Get specific machine by ID."""
-        machines = self.get_machines()
-        for machine in machines:
-            if machine.get("machine_id") == machine_id:
-                return machine
-        return None
+        return self._get_lookup(self.FACTORY_MODEL_FILE, "machines", "machine_id").get(machine_id)
     
     def get_work_centers(self) -> List[Dict[str, Any]]:
         """Get all work centers from factory model."""
-        factory_data = self.get_factory_model()
-        return factory_data.get("data", {}).get("work_centers", [])
+        return self._get_section(self.FACTORY_MODEL_FILE, "work_centers")
     
     def get_products(self) -> List[Dict[str, Any]]:
         """Get all products from factory model."""
-        factory_data = self.get_factory_model()
-        return factory_data.get("data", {}).get("products", [])
+        return self._get_section(self.FACTORY_MODEL_FILE, "products")
+    
+    def get_product_by_id(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """Get specific product by ID."""
+        return self._get_lookup(self.FACTORY_MODEL_FILE, "products", "id").get(product_id)
+    
+    def get_machines_response(self) -> Dict[str, Any]:
+        """Get the get_machines tool response, rebuilt only after the cache is cleared."""
+        return self._get_section_response(self.FACTORY_MODEL_FILE, "machines", "total_machines")
+    
+    def get_products_response(self) -> Dict[str, Any]:
+        """Get the get_products tool response, rebuilt only after the cache is cleared."""
+        return self._get_section_response(self.FACTORY_MODEL_FILE, "products", "total_products")
+    
+    def get_customers_response(self) -> Dict[str, Any]:
+        """Get the unfiltered get_customers tool response, rebuilt only after the cache is cleared."""
+        return self._get_section_response("erp/business_data.json", "customers", "total_customers")
+    
+    def get_customer_by_id(self, customer_id: str) -> Optional[Dict[str, Any]]:
+        """Get specific customer by ID."""
+        return self._get_lookup("erp/business_data.json", "customers", "customer_id").get(customer_id)
+    
+    def get_employee_by_id(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Get specific employee by ID."""
+        return self.get_wpms_lookup("employees", "employee_id").get(employee_id)
 
 # Global instance
 data_loader = JSONDataLoader()
\ No newline at end of file
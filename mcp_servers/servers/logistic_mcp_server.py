@@ -1,8 +1,15 @@
 # mcp_server_shipping.py
 from mcp.server.fastmcp import FastMCP
+from starlette.responses import Response
 import datetime
+import json
+import os
+import shelve
+import threading
+import time
+from math import asin, cos, radians, sin, sqrt
 from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
+from geopy.exc import GeopyError
 from functools import lru_cache
 import logging
 
@@ -24,22 +31,61 @@ SERVER_INFO = {
     "data_source": "local_json_files"
 }
 
+# SERVER_INFO is static after startup, so serialize it once (same encoding as JSONResponse)
+SERVER_INFO_BYTES = json.dumps(SERVER_INFO, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
 @mcp.custom_route("/info", methods=["GET"])
 async def server_info(request):
     """Server information endpoint."""
-    from starlette.responses import JSONResponse
-    return JSONResponse(content=SERVER_INFO)
+    return Response(content=SERVER_INFO_BYTES, media_type="application/json")
+
+# Mean Earth radius used for great-circle distances
+EARTH_RADIUS_KM = 6371.0088
 
 # Geocoder (set a distinct user_agent per Nominatim policy)
 _geolocator = Nominatim(user_agent="logistic_mcp_server", timeout=10)
 
+# On-disk geocode cache so lookups survive restarts
+GEOCODE_CACHE_PATH = os.path.expanduser("~/.cache/logistic_mcp/geocode.db")
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 3600
+_geocode_cache_lock = threading.Lock()
+
+def _read_geocode_cache(key: str):
+    try:
+        with _geocode_cache_lock, shelve.open(GEOCODE_CACHE_PATH) as cache:
+            return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Geocode cache read failed: {e}")
+        return None
+
+def _write_geocode_cache(key: str, coords):
+    try:
+        os.makedirs(os.path.dirname(GEOCODE_CACHE_PATH), exist_ok=True)
+        with _geocode_cache_lock, shelve.open(GEOCODE_CACHE_PATH) as cache:
+            cache[key] = {"coords": coords, "fetched_at": time.time()}
+    except Exception as e:
+        logger.warning(f"Geocode cache write failed: {e}")
+
 @lru_cache(maxsize=512)
 def _geocode(city: str, country: str):
-    q = f"{city.strip()}, {country.strip()}"
-    loc = _geolocator.geocode(q, exactly_one=True, addressdetails=False)
+    # Callers pass normalized names, so cache hits never reach this body
+    q = f"{city}, {country}"
+    cached = _read_geocode_cache(q)
+    if cached and time.time() - cached["fetched_at"] < GEOCODE_CACHE_TTL_SECONDS:
+        return cached["coords"]
+    try:
+        loc = _geolocator.geocode(q, exactly_one=True, addressdetails=False)
+    except GeopyError as e:
+        if cached:
+            # Serve the stale entry rather than failing the tool call
+            logger.warning(f"Geocoding failed for {q}, using cached coordinates: {e}")
+            return cached["coords"]
+        raise
     if not loc:
         raise ValueError(f"Could not geocode: {q}")
-    return (loc.latitude, loc.longitude)
+    coords = (loc.latitude, loc.longitude)
+    _write_geocode_cache(q, coords)
+    return coords
 
 @mcp.tool()
 def calculate_shipping_metrics(
@@ -52,11 +98,15 @@ def calculate_shipping_metrics(
     Outputs: Distance in KM, Transport Time in hours for normal and expedited shipping,
     plus transport prices (EUR) at 0.04 €/km (normal) and 0.64 €/km (expedited).
     """
-    lat1, lon1 = _geocode(city1, country1)
-    lat2, lon2 = _geocode(city2, country2)
+    # Normalize so "Paris", " paris " and "PARIS" share one cache entry
+    lat1, lon1 = _geocode(city1.strip().lower(), country1.strip().lower())
+    lat2, lon2 = _geocode(city2.strip().lower(), country2.strip().lower())
 
-    # Distance (km) via great-circle
-    distance_km = geodesic((lat1, lon1), (lat2, lon2)).kilometers
+    # Distance (km) via great-circle (haversine on the mean Earth radius)
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    distance_km = 2 * EARTH_RADIUS_KM * asin(sqrt(a))
 
     # Shipping speeds
     normal_speed_kmh = 30.0       # ground/standard shipping average
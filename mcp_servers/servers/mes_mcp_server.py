@@ -3,19 +3,28 @@ MES (Manufacturing Execution System) MCP Server
 Provides production and manufacturing tools using local JSON data.
 """
 from fastmcp import FastMCP
+from starlette.responses import Response
 import datetime
 import uuid
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from types import MappingProxyType, SimpleNamespace
+from typing import List, Dict, Any, Mapping, Optional
 from json_data_loader import data_loader
+from server_utils import dumps, json_response, make_error_handler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('MES-Server')
+handle_errors = make_error_handler(logger)
 
 # Initialize FastMCP
 mcp = FastMCP("MES Server 🏭")
 
+# Server start time for reporting; uptime is measured on the monotonic clock
+STARTED_AT = datetime.datetime.now()
+STARTED_MONOTONIC = time.monotonic()
+
 # Server metadata
 SERVER_INFO = {
     "name": "MES Server",
@@ -23,60 +32,70 @@ SERVER_INFO = {
     "description": "Manufacturing Execution System - GlobalApparel",
     "port": 8003,
     "status": "running",
-    "started_at": datetime.datetime.now().isoformat(),
+    "started_at": STARTED_AT.isoformat(),
     "data_source": "local_json_files"
 }
 
+# /health body with the static members pre-encoded; only status, timestamp and uptime vary
+_HEALTH_STATIC = dumps({"server": "MES", "port": 8003, "data_source": "local_json_files"})[1:-1]
+_HEALTH_TEMPLATE = b'{"status":"%s","timestamp":"%s",' + _HEALTH_STATIC + b',"uptime_seconds":%s}'
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
     """Health check endpoint."""
     try:
-        from starlette.responses import JSONResponse
-        
-        # Test data loading
-        mes_data = data_loader.get_mes_data()
-        data_status = "healthy" if mes_data.get("data") else "unhealthy"
-        
-        health_data = {
-            "status": data_status,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "server": "MES",
-            "port": 8003,
-            "data_source": "local_json_files",
-            "uptime_seconds": (datetime.datetime.now() - datetime.datetime.fromisoformat(SERVER_INFO["started_at"])).total_seconds()
-        }
+        # Check the data the tools actually serve, bound once by reload_mes_cache()
+        data_status = "healthy" if _MES else "unhealthy"
         
-        return JSONResponse(content=health_data, status_code=200 if data_status == "healthy" else 503)
+        body = _HEALTH_TEMPLATE % (
+            data_status.encode(),
+            datetime.datetime.now().isoformat().encode(),
+            repr(time.monotonic() - STARTED_MONOTONIC).encode()
+        )
+        return Response(content=body, status_code=200 if data_status == "healthy" else 503, media_type="application/json")
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return JSONResponse(content={"status": "error", "message": str(e)}, status_code=500)
+        return json_response({"status": "error", "message": str(e)}, status_code=500)
+
+# SERVER_INFO is static after startup, so serialize it once
+SERVER_INFO_BYTES = dumps(SERVER_INFO)
 
 @mcp.custom_route("/info", methods=["GET"])
 async def server_info(request):
     """Server information endpoint."""
-    from starlette.responses import JSONResponse
-    return JSONResponse(content=SERVER_INFO)
+    return Response(content=SERVER_INFO_BYTES, media_type="application/json")
 
-def handle_errors(func):
-    """Error handling decorator."""
-    def wrapper(*args, **kwargs):
-        try:
-            result = func(*args, **kwargs)
-            logger.debug(f"Tool {func.__name__} executed successfully")
-            return result
-        except Exception as e:
-            logger.error(f"Error in tool {func.__name__}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "tool": func.__name__,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-    return wrapper
+# MES data sections, bound once at import so tools skip the loader on every call
+_MES: Mapping[str, Any] = MappingProxyType({})
+_D = SimpleNamespace(work_centers=(), machines=(), work_orders=(), quality_metrics=(), machine_criticality=(), production_metrics={})
+
+# get_work_centers response envelope, rebuilt only on reload
+_RESP_WORK_CENTERS: Dict[str, Any] = {}
+
+def reload_mes_cache():
+    """Reload the MES data file if it changed on disk and rebind the cached sections."""
+    global _MES, _D
+    global _RESP_WORK_CENTERS
+    data_loader.invalidate("mes/production_data.json")
+    # Frozen views: tools only read these, and tuples make accidental mutation fail loudly
+    _MES = MappingProxyType(data_loader.get_mes_data().get("data", {}))
+    _D = SimpleNamespace(
+        work_centers=tuple(_MES.get("work_centers", ())),
+        machines=tuple(_MES.get("machines", ())),
+        work_orders=tuple(_MES.get("work_orders", ())),
+        quality_metrics=tuple(_MES.get("quality_metrics", ())),
+        machine_criticality=tuple(_MES.get("machine_criticality", ())),
+        production_metrics=_MES.get("production_metrics", {})
+    )
+    
+    _RESP_WORK_CENTERS = {"success": True, "work_centers": _D.work_centers, "total_work_centers": len(_D.work_centers)}
+    logger.info(f"MES cache loaded: {len(_D.work_centers)} work centers, {len(_D.machines)} machines")
+
+reload_mes_cache()
 
-@handle_errors
 @mcp.tool
-def get_work_centers() -> Dict[str, Any]:
+@handle_errors
+async def get_work_centers() -> Dict[str, Any]:
     """
     Get all work centers and their capacity and production factor in the manufacturing system.
     
@@ -85,14 +104,7 @@ def get_work_centers() -> Dict[str, Any]:
     """
     logger.info("Getting work centers")
     
-    mes_data = data_loader.get_mes_data()
-    work_centers = mes_data.get("data", {}).get("work_centers", [])
-    
-    return {
-        "success": True,
-        "work_centers": work_centers,
-        "total_work_centers": len(work_centers)
-    }
+    return _RESP_WORK_CENTERS
 
 # @handle_errors
 # @mcp.tool
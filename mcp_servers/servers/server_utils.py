@@ -0,0 +1,79 @@
+"""
+Shared HTTP, error-handling and ID helpers for the MCP servers.
+"""
+import collections
+import datetime
+import functools
+import inspect
+import json
+import logging
+import secrets
+from typing import Any, Callable, Dict
+from starlette.responses import Response
+
+try:
+    import orjson
+    dumps = orjson.dumps
+except ImportError:
+    def dumps(content: Any) -> bytes:
+        # Same compact encoding as Starlette's JSONResponse
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Build a JSON HTTP response, encoded with orjson when it is installed."""
+    return Response(content=dumps(content), status_code=status_code, media_type="application/json")
+
+def make_error_handler(logger: logging.Logger) -> Callable:
+    """Build a handle_errors decorator that reports to the given server logger."""
+    def handle_errors(func):
+        """Error handling decorator for sync and async tools."""
+        # Resolved once, when the tool is defined
+        tool_name = func.__name__
+
+        def error_response(e: Exception) -> Dict[str, Any]:
+            logger.error("Error in tool %s: %s", tool_name, e)
+            return {
+                "success": False,
+                "error": str(e),
+                "tool": tool_name,
+                "timestamp": datetime.datetime.now().isoformat()
+            }
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    result = await func(*args, **kwargs)
+                    logger.debug("Tool %s executed successfully", tool_name)
+                    return result
+                except Exception as e:
+                    return error_response(e)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    result = func(*args, **kwargs)
+                    logger.debug("Tool %s executed successfully", tool_name)
+                    return result
+                except Exception as e:
+                    return error_response(e)
+        return wrapper
+    return handle_errors
+
+def make_id_suffix_pool(length: int, pool_size: int = 1024, upper: bool = False) -> Callable[[], str]:
+    """Build a function that pops random hex ID suffixes of the given length.
+
+    Suffixes are drawn from the CSPRNG in batches of pool_size rather than per ID.
+    """
+    suffixes = collections.deque()
+
+    def next_id_suffix() -> str:
+        try:
+            return suffixes.popleft()
+        except IndexError:
+            raw = secrets.token_hex((length * pool_size + 1) // 2)
+            if upper:
+                raw = raw.upper()
+            suffixes.extend(raw[i:i + length] for i in range(0, length * pool_size, length))
+            return suffixes.popleft()
+    return next_id_suffix
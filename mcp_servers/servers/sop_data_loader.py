@@ -8,16 +8,56 @@ and search capabilities.
 
 import os
 import re
+import codecs
 import json
 import logging
+import bisect
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 import boto3
+from botocore.config import Config as BotocoreConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
 logger = logging.getLogger(__name__)
 
+# Patterns used when parsing and searching SOP markdown, compiled once at import
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_DOC_CONTROL_RE = re.compile(r'##\s+Document Control\s*\n(.*?)(?=\n##|\n---|\Z)', re.DOTALL | re.IGNORECASE)
+_DOC_FIELDS_RE = re.compile(
+    r'\*\*(Document ID|Version|Effective Date|Review Date|Owner|Approved By):\*\*\s*(.+?)(?:\n|$)',
+    re.IGNORECASE
+)
+_FIELD_KEY = {
+    'document id': 'document_id',
+    'version': 'version',
+    'effective date': 'effective_date',
+    'review date': 'review_date',
+    'owner': 'owner',
+    'approved by': 'approved_by'
+}
+_SECTION_RE = re.compile(r'^##\s+(\d+\.?\s*)?(.+)$', re.MULTILINE)
+_HEADING_RE = re.compile(r'^(#{1,3})\s+(.+)$', re.MULTILINE)
+_TOKEN_RE = re.compile(r'\w+')
+_WORD_RE = re.compile(r'\S+')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_kw(keyword_lower: str) -> re.Pattern:
+    """Compile a literal keyword matcher; the lookahead also reports overlapping matches."""
+    return re.compile(f"(?={re.escape(keyword_lower)})")
+
+
+# Concurrent S3 GETs when loading; stays within the client's connection pool
+S3_READ_WORKERS = 32
+# Size of the chunks streamed from an S3 object body while decoding
+S3_READ_CHUNK_SIZE = 65536
+
+# Shorter keywords match nearly every document and are rejected by search_sops
+MIN_KEYWORD_LENGTH = 2
+
 class SOPDataLoader:
     """
     Utility class for loading and managing SOP documents from markdown files.
@@ -52,6 +92,18 @@ class SOPDataLoader:
         self._sop_cache: Dict[str, Dict[str, Any]] = {}
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl_seconds = 3600  # 1 hour cache TTL
+        # S3 filename -> (ETag, size) of the objects currently held in _sop_cache
+        self._manifest: Dict[str, Tuple[str, int]] = {}
+        # Search structures rebuilt with the cache: token -> filename -> offsets, and lowered content
+        self._index: Dict[str, Dict[str, List[int]]] = {}
+        self._content_lower: Dict[str, str] = {}
+        self._headings: Dict[str, Tuple[List[int], List[str]]] = {}
+        # Every 3-character substring of the lowered corpus, to reject absent keywords early
+        self._corpus_ngrams: Set[str] = set()
+        # Uppercased document_id -> filename for get_sop_by_id
+        self._id_index: Dict[str, str] = {}
+        # Summary list served by list_sops, rebuilt with the cache
+        self._list_view: Optional[List[Dict[str, Any]]] = None
         
         # Initialize S3 client if needed
         self._s3_client = None
@@ -65,11 +117,20 @@ class SOPDataLoader:
             aws_profile = os.getenv("AWS_PROFILE")
             aws_region = os.getenv("AWS_REGION", "us-east-1")
             
+            # Pooled keep-alive connections so per-file GETs reuse TLS sessions
+            client_config = BotocoreConfig(
+                max_pool_connections=50,
+                retries={'max_attempts': 5, 'mode': 'adaptive'},
+                tcp_keepalive=True,
+                connect_timeout=3,
+                read_timeout=10
+            )
+            
             if aws_profile:
                 session = boto3.Session(profile_name=aws_profile, region_name=aws_region)
-                self._s3_client = session.client('s3')
+                self._s3_client = session.client('s3', config=client_config)
             else:
-                self._s3_client = boto3.client('s3', region_name=aws_region)
+                self._s3_client = boto3.client('s3', region_name=aws_region, config=client_config)
             
             # Test S3 connectivity
             self._s3_client.head_bucket(Bucket=self.s3_bucket)
@@ -104,7 +165,7 @@ class SOPDataLoader:
             List of SOP filenames
         """
         if self.use_s3 and self._s3_client:
-            return self._list_s3_files()
+            return [obj['filename'] for obj in self._list_s3_files()]
         else:
             return self._list_local_files()
     
@@ -115,42 +176,50 @@ class SOPDataLoader:
                 logger.warning(f"SOP directory does not exist: {self.base_path}")
                 return []
             
-            files = []
-            for filename in os.listdir(self.base_path):
-                if filename.endswith('.md') and os.path.isfile(os.path.join(self.base_path, filename)):
-                    files.append(filename)
+            # DirEntry.is_file() uses the type from the directory read, avoiding a stat per entry
+            with os.scandir(self.base_path) as entries:
+                files = sorted(entry.name for entry in entries if entry.name.endswith('.md') and entry.is_file())
             
             logger.debug(f"Found {len(files)} SOP files in local directory: {self.base_path}")
-            return sorted(files)
+            return files
             
         except Exception as e:
             logger.error(f"Error listing local SOP files: {e}")
             return []
     
-    def _list_s3_files(self) -> List[str]:
-        """List SOP files from S3 storage."""
+    def _list_s3_files(self) -> List[Dict[str, Any]]:
+        """
+        List SOP files from S3 storage.
+        
+        Returns:
+            List of dicts with filename, size and etag, taken straight from
+            the listing so no per-object metadata requests are needed
+        """
         try:
-            response = self._s3_client.list_objects_v2(
-                Bucket=self.s3_bucket,
-                Prefix=self.s3_prefix
-            )
+            # Paginate so buckets with more than 1000 objects under the prefix are listed in full
+            paginator = self._s3_client.get_paginator('list_objects_v2')
+            prefix_len = len(self.s3_prefix)
             
             files = []
-            for obj in response.get('Contents', []):
-                key = obj['Key']
-                # Extract filename from S3 key
-                filename = key.replace(self.s3_prefix, '')
-                if filename.endswith('.md') and '/' not in filename:  # Only direct files, not subdirectories
-                    files.append(filename)
+            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=self.s3_prefix, PaginationConfig={'PageSize': 1000}):
+                for obj in page.get('Contents', ()):
+                    # Every key starts with the prefix, so strip it by position
+                    filename = obj['Key'][prefix_len:]
+                    if filename.endswith('.md') and '/' not in filename:  # Only direct files, not subdirectories
+                        files.append({
+                            'filename': filename,
+                            'size': obj.get('Size', 0),
+                            'etag': obj.get('ETag', '')
+                        })
             
             logger.debug(f"Found {len(files)} SOP files in S3 bucket: {self.s3_bucket}")
-            return sorted(files)
+            return sorted(files, key=lambda x: x['filename'])
             
         except Exception as e:
             logger.error(f"Error listing S3 SOP files: {e}")
             return []
     
-    def _read_sop_file(self, filename: str) -> Optional[str]:
+    def _read_sop_file(self, filename: str) -> Tuple[Optional[str], int, Optional[str]]:
         """
         Read SOP file content from storage.
         
@@ -158,57 +227,67 @@ class SOPDataLoader:
             filename: Name of the SOP file to read
             
         Returns:
-            File content as string, or None if error
+            Tuple of (file content as string or None if error, stored size in bytes,
+            ISO modification time or None)
         """
         if self.use_s3 and self._s3_client:
             return self._read_s3_file(filename)
         else:
             return self._read_local_file(filename)
     
-    def _read_local_file(self, filename: str) -> Optional[str]:
+    def _read_local_file(self, filename: str) -> Tuple[Optional[str], int, Optional[str]]:
         """Read SOP file from local file system."""
         try:
             file_path = os.path.join(self.base_path, filename)
             with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                stat = os.fstat(f.fileno())
                 content = f.read()
             
             logger.debug(f"Read local SOP file: {filename}")
-            return content
+            return content, stat.st_size, datetime.fromtimestamp(stat.st_mtime).isoformat()
             
         except FileNotFoundError:
             logger.error(f"SOP file not found: {filename}")
-            return None
+            return None, 0, None
         except Exception as e:
             logger.error(f"Error reading local SOP file {filename}: {e}")
-            return None
+            return None, 0, None
     
-    def _read_s3_file(self, filename: str) -> Optional[str]:
+    def _read_s3_file(self, filename: str) -> Tuple[Optional[str], int, Optional[str]]:
         """Read SOP file from S3 storage."""
         try:
             key = f"{self.s3_prefix}{filename}"
             response = self._s3_client.get_object(Bucket=self.s3_bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
+            
+            # Decode chunk by chunk so the whole body is never held as bytes and str at once
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            parts = [decoder.decode(chunk) for chunk in response['Body'].iter_chunks(chunk_size=S3_READ_CHUNK_SIZE)]
+            parts.append(decoder.decode(b'', final=True))
+            content = ''.join(parts)
+            
+            last_modified = response.get('LastModified')
             
             logger.debug(f"Read S3 SOP file: {filename}")
-            return content
+            return content, response.get('ContentLength', 0), last_modified.isoformat() if last_modified else None
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 logger.error(f"SOP file not found in S3: {filename}")
             else:
                 logger.error(f"Error reading S3 SOP file {filename}: {e}")
-            return None
+            return None, 0, None
         except Exception as e:
             logger.error(f"Unexpected error reading S3 SOP file {filename}: {e}")
-            return None
+            return None, 0, None
     
-    def _parse_sop_metadata(self, content: str, filename: str) -> Dict[str, Any]:
+    def _parse_sop_metadata(self, content: str, filename: str, last_modified: Optional[str] = None) -> Dict[str, Any]:
         """
         Parse metadata from SOP markdown content.
         
         Args:
             content: Raw markdown content
             filename: SOP filename
+            last_modified: Modification time of the source file, defaults to now
             
         Returns:
             Dictionary containing parsed metadata
@@ -222,45 +301,34 @@ class SOPDataLoader:
             'review_date': '',
             'owner': '',
             'approved_by': '',
-            'word_count': len(content.split()),
-            'last_modified': datetime.now().isoformat(),
+            'word_count': sum(1 for _ in _WORD_RE.finditer(content)),
+            'last_modified': last_modified or datetime.now().isoformat(),
             'storage_location': 's3' if self.use_s3 else 'local'
         }
         
         try:
             # Extract title from first heading
-            title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+            title_match = _TITLE_RE.search(content)
             if title_match:
                 metadata['title'] = title_match.group(1).strip()
             
             # Parse document control section
-            doc_control_section = re.search(
-                r'##\s+Document Control\s*\n(.*?)(?=\n##|\n---|\Z)', 
-                content, 
-                re.DOTALL | re.IGNORECASE
-            )
+            doc_control_section = _DOC_CONTROL_RE.search(content)
             
             if doc_control_section:
                 control_content = doc_control_section.group(1)
                 
-                # Extract metadata fields using regex patterns
-                patterns = {
-                    'document_id': r'\*\*Document ID:\*\*\s*(.+?)(?:\n|$)',
-                    'version': r'\*\*Version:\*\*\s*(.+?)(?:\n|$)',
-                    'effective_date': r'\*\*Effective Date:\*\*\s*(.+?)(?:\n|$)',
-                    'review_date': r'\*\*Review Date:\*\*\s*(.+?)(?:\n|$)',
-                    'owner': r'\*\*Owner:\*\*\s*(.+?)(?:\n|$)',
-                    'approved_by': r'\*\*Approved By:\*\*\s*(.+?)(?:\n|$)'
-                }
-                
-                for field, pattern in patterns.items():
-                    match = re.search(pattern, control_content, re.IGNORECASE)
-                    if match:
-                        metadata[field] = match.group(1).strip()
+                # Extract all metadata fields in one scan; the first occurrence of each wins
+                found = set()
+                for match in _DOC_FIELDS_RE.finditer(control_content):
+                    field = _FIELD_KEY[match.group(1).lower()]
+                    if field not in found:
+                        found.add(field)
+                        metadata[field] = match.group(2).strip()
             
             # Parse sections for structure analysis
             sections = []
-            section_matches = re.finditer(r'^##\s+(\d+\.?\s*)?(.+)$', content, re.MULTILINE)
+            section_matches = _SECTION_RE.finditer(content)
             
             for match in section_matches:
                 section_number = match.group(1).strip() if match.group(1) else ''
@@ -308,19 +376,44 @@ class SOPDataLoader:
         sops = {}
         
         try:
-            filenames = self._list_sop_files()
+            if self.use_s3 and self._s3_client:
+                # Diff the listing against the manifest so only new or changed objects are fetched
+                manifest = {obj['filename']: (obj['etag'], obj['size']) for obj in self._list_s3_files()}
+                filenames = list(manifest)
+                changed = [
+                    filename for filename in filenames
+                    if filename not in self._sop_cache or self._manifest.get(filename) != manifest[filename]
+                ]
+            else:
+                manifest = {}
+                filenames = self._list_sop_files()
+                changed = filenames
+            
+            if self.use_s3 and changed:
+                # Overlap the per-object round-trips; local disk reads stay serial
+                with ThreadPoolExecutor(max_workers=min(S3_READ_WORKERS, len(changed))) as executor:
+                    contents = dict(zip(changed, executor.map(self._read_sop_file, changed)))
+            else:
+                contents = {filename: self._read_sop_file(filename) for filename in changed}
             
+            now_iso = datetime.now().isoformat()
             for filename in filenames:
-                content = self._read_sop_file(filename)
+                if filename not in contents:
+                    # Unchanged since the last load, keep the parsed entry
+                    sops[filename] = self._sop_cache[filename]
+                    continue
+                
+                content, file_size, last_modified = contents[filename]
                 if content:
-                    metadata = self._parse_sop_metadata(content, filename)
+                    # Prefer the source's own modification time over the load time
+                    metadata = self._parse_sop_metadata(content, filename, last_modified or now_iso)
                     
                     sops[filename] = {
                         **metadata,
                         'content': content,
                         'metadata': {
-                            'file_size': len(content.encode('utf-8')),
-                            'last_modified': datetime.now().isoformat(),
+                            'file_size': file_size,
+                            'last_modified': metadata['last_modified'],
                             'word_count': metadata['word_count'],
                             'storage_location': metadata['storage_location']
                         }
@@ -330,9 +423,17 @@ class SOPDataLoader:
             
             # Update cache
             self._sop_cache = sops
+            self._manifest = {filename: manifest[filename] for filename in sops if filename in manifest}
+            self._build_search_index(sops)
+            self._id_index = {}
+            for filename, sop_data in sops.items():
+                if sop_data.get('document_id'):
+                    # First SOP with a given ID wins, matching the previous linear scan
+                    self._id_index.setdefault(sop_data['document_id'].upper(), filename)
+            self._list_view = self._build_list_view(sops)
             self._cache_timestamp = datetime.now()
             
-            logger.info(f"Successfully loaded {len(sops)} SOP documents")
+            logger.info(f"Successfully loaded {len(sops)} SOP documents ({len(contents)} fetched)")
             
         except Exception as e:
             logger.error(f"Error loading SOPs: {e}")
@@ -341,6 +442,62 @@ class SOPDataLoader:
         
         return sops
     
+    def _build_search_index(self, sops: Dict[str, Dict[str, Any]]):
+        """Build the inverted token index and lowered content used by search_sops."""
+        index: Dict[str, Dict[str, List[int]]] = {}
+        content_lower: Dict[str, str] = {}
+        headings: Dict[str, Tuple[List[int], List[str]]] = {}
+        ngrams: Set[str] = set()
+        
+        for filename, sop_data in sops.items():
+            content = sop_data.get('content', '')
+            headings[filename] = self._scan_headings(content)
+            lowered = content.lower()
+            content_lower[filename] = lowered
+            ngrams.update(lowered[i:i + 3] for i in range(len(lowered) - 2))
+            for match in _TOKEN_RE.finditer(lowered):
+                index.setdefault(match.group(), {}).setdefault(filename, []).append(match.start())
+        
+        self._index = index
+        self._content_lower = content_lower
+        self._headings = headings
+        self._corpus_ngrams = ngrams
+    
+    def _lookup_keyword(self, keyword_lower: str) -> Dict[str, Tuple[int, List[int]]]:
+        """
+        Resolve a single-token keyword against the inverted index.
+        
+        A keyword made only of word characters can only occur inside a single
+        token, so substring matches are found by checking the vocabulary rather
+        than scanning every document.
+        
+        Returns:
+            Dictionary mapping filename to (match count, sorted match positions)
+        """
+        hits: Dict[str, Tuple[int, List[int]]] = {}
+        
+        for token, postings in self._index.items():
+            token_count = token.count(keyword_lower)
+            if not token_count:
+                continue
+            
+            # Offsets of every (possibly overlapping) occurrence within the token
+            offsets = []
+            offset = token.find(keyword_lower)
+            while offset != -1:
+                offsets.append(offset)
+                offset = token.find(keyword_lower, offset + 1)
+            
+            for filename, starts in postings.items():
+                count, positions = hits.get(filename, (0, []))
+                positions.extend(start + offset for start in starts for offset in offsets)
+                hits[filename] = (count + token_count * len(starts), positions)
+        
+        for count, positions in hits.values():
+            positions.sort()
+        
+        return hits
+    
     def get_sop_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Get specific SOP by filename.
@@ -366,11 +523,8 @@ class SOPDataLoader:
         """
         sops = self.load_sops()
         
-        for sop_data in sops.values():
-            if sop_data.get('document_id', '').upper() == document_id.upper():
-                return sop_data
-        
-        return None
+        filename = self._id_index.get(document_id.upper())
+        return sops.get(filename) if filename else None
     
     def search_sops(self, keyword: str, search_in: str = "all") -> List[Dict[str, Any]]:
         """
@@ -383,16 +537,28 @@ class SOPDataLoader:
         Returns:
             List of matching SOPs with relevance information
         """
-        if not keyword.strip():
+        if len(keyword.strip()) < MIN_KEYWORD_LENGTH:
             return []
         
         sops = self.load_sops()
         results = []
         keyword_lower = keyword.lower()
         
-        for sop_data in sops.values():
+        # Titles come from the content, so a keyword with any 3-gram absent from the corpus cannot match
+        if self._corpus_ngrams and any(
+            keyword_lower[i:i + 3] not in self._corpus_ngrams for i in range(len(keyword_lower) - 2)
+        ):
+            return []
+        
+        # Single-word keywords are served from the index; phrases fall back to scanning
+        hits = None
+        if search_in in ["content", "all"] and _TOKEN_RE.fullmatch(keyword_lower):
+            hits = self._lookup_keyword(keyword_lower)
+        
+        for filename, sop_data in sops.items():
             matches = []
             total_matches = 0
+            title_matches = 0
             
             # Search in title
             if search_in in ["title", "all"]:
@@ -408,19 +574,21 @@ class SOPDataLoader:
             
             # Search in content
             if search_in in ["content", "all"]:
-                content = sop_data.get('content', '').lower()
-                content_matches = content.count(keyword_lower)
+                content = sop_data.get('content', '')
+                content_lower = self._content_lower.get(filename)
+                if content_lower is None:
+                    content_lower = content.lower()
+                
+                if hits is not None:
+                    content_matches, positions = hits.get(filename, (0, None))
+                else:
+                    content_matches, positions = content_lower.count(keyword_lower), None
                 
                 if content_matches > 0:
-                    # Find excerpts around matches
-                    excerpts = self._extract_excerpts(sop_data.get('content', ''), keyword, max_excerpts=3)
-                    
-                    for excerpt in excerpts:
-                        matches.append({
-                            'section': excerpt.get('section', 'Content'),
-                            'text': excerpt['text'],
-                            'match_count': excerpt['match_count']
-                        })
+                    # Excerpts are capped here; with at most one title match this stays
+                    # within the five excerpts a result carries
+                    matches.extend(self._extract_excerpts(content, content_lower, keyword, max_excerpts=3, positions=positions,
+                                                          headings=self._headings.get(filename)))
                     
                     total_matches += content_matches
             
@@ -430,7 +598,6 @@ class SOPDataLoader:
                 relevance_score = min(total_matches / 10.0, 1.0)  # Normalize to 0-1
                 
                 # Boost score for title matches
-                title_matches = sum(m['match_count'] for m in matches if m['section'] == 'Title')
                 if title_matches > 0:
                     relevance_score = min(relevance_score + 0.3, 1.0)
                 
@@ -440,7 +607,7 @@ class SOPDataLoader:
                     'document_id': sop_data.get('document_id', ''),
                     'relevance_score': round(relevance_score, 2),
                     'total_matches': total_matches,
-                    'excerpts': matches[:5]  # Limit excerpts
+                    'excerpts': matches
                 })
         
         # Sort by relevance score (descending)
@@ -448,32 +615,34 @@ class SOPDataLoader:
         
         return results
     
-    def _extract_excerpts(self, content: str, keyword: str, max_excerpts: int = 3, context_chars: int = 150) -> List[Dict[str, Any]]:
+    def _extract_excerpts(self, content: str, content_lower: str, keyword: str, max_excerpts: int = 3, context_chars: int = 150,
+                          positions: Optional[List[int]] = None,
+                          headings: Optional[Tuple[List[int], List[str]]] = None) -> List[Dict[str, Any]]:
         """
         Extract text excerpts around keyword matches.
         
         Args:
             content: Full text content
+            content_lower: Lowercased content, as already computed by the caller
             keyword: Search keyword
             max_excerpts: Maximum number of excerpts to return
             context_chars: Characters of context around each match
+            positions: Sorted match positions, if already known from the search index
+            headings: Heading offsets and titles from _scan_headings, if already known
             
         Returns:
             List of excerpt dictionaries
         """
         excerpts = []
         keyword_lower = keyword.lower()
-        content_lower = content.lower()
-        
-        # Find all match positions
-        positions = []
-        start = 0
-        while True:
-            pos = content_lower.find(keyword_lower, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
+        
+        # Find match positions, stopping once there are enough candidates
+        if positions is None:
+            positions = []
+            for match in _compile_kw(keyword_lower).finditer(content_lower):
+                positions.append(match.start())
+                if len(positions) >= max_excerpts * 2:
+                    break
         
         # Extract excerpts around matches
         used_ranges = []
@@ -483,20 +652,17 @@ class SOPDataLoader:
             start_pos = max(0, pos - context_chars)
             end_pos = min(len(content), pos + len(keyword) + context_chars)
             
-            # Check for overlap with existing excerpts
-            overlaps = any(
-                not (end_pos <= r[0] or start_pos >= r[1])
-                for r in used_ranges
-            )
+            # Positions ascend, so only the last accepted excerpt can overlap
+            overlaps = bool(used_ranges) and start_pos < used_ranges[-1][1]
             
             if not overlaps and len(excerpts) < max_excerpts:
                 excerpt_text = content[start_pos:end_pos].strip()
                 
                 # Try to find section context
-                section_name = self._find_section_for_position(content, pos)
+                section_name = self._find_section_for_position(content, pos, headings)
                 
-                # Count matches in this excerpt
-                match_count = excerpt_text.lower().count(keyword_lower)
+                # Count matches in this excerpt without slicing or lowering it again
+                match_count = content_lower.count(keyword_lower, start_pos, end_pos)
                 
                 excerpts.append({
                     'section': section_name or 'Content',
@@ -508,19 +674,25 @@ class SOPDataLoader:
         
         return excerpts
     
-    def _find_section_for_position(self, content: str, position: int) -> Optional[str]:
+    def _scan_headings(self, content: str) -> Tuple[List[int], List[str]]:
+        """Collect the offsets and titles of all section headings, in document order."""
+        offsets = []
+        titles = []
+        for match in _HEADING_RE.finditer(content):
+            offsets.append(match.start())
+            titles.append(match.group(2).strip())
+        return offsets, titles
+    
+    def _find_section_for_position(self, content: str, position: int,
+                                   headings: Optional[Tuple[List[int], List[str]]] = None) -> Optional[str]:
         """Find the section heading that contains the given position."""
         try:
-            # Find all section headings before the position
-            headings = []
-            for match in re.finditer(r'^(#{1,3})\s+(.+)$', content[:position], re.MULTILINE):
-                level = len(match.group(1))
-                title = match.group(2).strip()
-                headings.append((level, title, match.start()))
+            offsets, titles = headings if headings is not None else self._scan_headings(content)
             
-            # Return the most recent heading
-            if headings:
-                return headings[-1][1]
+            # Most recent heading starting before the position
+            i = bisect.bisect_left(offsets, position) - 1
+            if i >= 0:
+                return titles[i]
             
         except Exception:
             pass
@@ -534,8 +706,11 @@ class SOPDataLoader:
         Returns:
             List of SOP metadata dictionaries
         """
-        sops = self.load_sops()
-        
+        self.load_sops()
+        return self._list_view or []
+    
+    def _build_list_view(self, sops: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the sorted SOP summary list returned by list_sops."""
         sop_list = []
         for sop_data in sops.values():
             sop_list.append({
@@ -563,6 +738,13 @@ class SOPDataLoader:
         """Clear the SOP cache."""
         logger.info("Clearing SOP cache")
         self._sop_cache.clear()
+        self._manifest.clear()
+        self._index.clear()
+        self._content_lower.clear()
+        self._headings.clear()
+        self._corpus_ngrams.clear()
+        self._id_index.clear()
+        self._list_view = None
         self._cache_timestamp = None
     
     def get_cache_info(self) -> Dict[str, Any]:
@@ -583,5 +765,14 @@ class SOPDataLoader:
             's3_prefix': self.s3_prefix if self.use_s3 else None
         }
 
-# Global instance for easy access
-sop_data_loader = SOPDataLoader()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_loader() -> SOPDataLoader:
+    """Return the shared SOP loader, creating it on first use rather than at import."""
+    return SOPDataLoader()
+
+
+def __getattr__(name: str):
+    # Keep `from sop_data_loader import sop_data_loader` working without an eager instance
+    if name == 'sop_data_loader':
+        return get_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
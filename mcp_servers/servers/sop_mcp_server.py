@@ -6,7 +6,7 @@ from fastmcp import FastMCP
 import datetime
 import logging
 from typing import List, Dict, Any, Optional
-from sop_data_loader import sop_data_loader
+from sop_data_loader import get_loader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -33,11 +33,12 @@ async def health_check(request):
         from starlette.responses import JSONResponse
         
         # Test SOP data loading
-        sops = sop_data_loader.load_sops()
+        loader = get_loader()
+        sops = loader.load_sops()
         data_status = "healthy" if sops else "unhealthy"
         
         # Get cache info for additional health details
-        cache_info = sop_data_loader.get_cache_info()
+        cache_info = loader.get_cache_info()
         
         health_data = {
             "status": data_status,
@@ -77,7 +78,7 @@ def list_sops() -> List[Dict[str, Any]]:
     """
     try:
         logger.info("Listing all SOPs")
-        sops = sop_data_loader.list_sops()
+        sops = get_loader().list_sops()
         logger.info(f"Found {len(sops)} SOPs")
         return sops
     except Exception as e:
@@ -102,7 +103,8 @@ def get_sop_by_name(name: str) -> Dict[str, Any]:
         if not name.endswith('.md'):
             name = f"{name}.md"
         
-        sop = sop_data_loader.get_sop_by_name(name)
+        loader = get_loader()
+        sop = loader.get_sop_by_name(name)
         
         if sop:
             logger.info(f"Found SOP: {sop.get('title', name)}")
@@ -112,7 +114,7 @@ def get_sop_by_name(name: str) -> Dict[str, Any]:
             return {
                 "success": False,
                 "error": f"SOP not found: {name}",
-                "available_sops": [s['name'] for s in sop_data_loader.list_sops()]
+                "available_sops": [s['name'] for s in loader.list_sops()]
             }
     except Exception as e:
         logger.error(f"Error retrieving SOP by name: {e}")
@@ -132,7 +134,8 @@ def get_sop_by_id(document_id: str) -> Dict[str, Any]:
     try:
         logger.info(f"Retrieving SOP by ID: {document_id}")
         
-        sop = sop_data_loader.get_sop_by_id(document_id)
+        loader = get_loader()
+        sop = loader.get_sop_by_id(document_id)
         
         if sop:
             logger.info(f"Found SOP: {sop.get('title', document_id)}")
@@ -142,7 +145,7 @@ def get_sop_by_id(document_id: str) -> Dict[str, Any]:
             return {
                 "success": False,
                 "error": f"SOP not found with ID: {document_id}",
-                "available_ids": [s['document_id'] for s in sop_data_loader.list_sops() if s.get('document_id')]
+                "available_ids": [s['document_id'] for s in loader.list_sops() if s.get('document_id')]
             }
     except Exception as e:
         logger.error(f"Error retrieving SOP by ID: {e}")
@@ -166,7 +169,7 @@ def search_sops(keyword: str, search_in: str = "all") -> List[Dict[str, Any]]:
         if not keyword.strip():
             return []
         
-        results = sop_data_loader.search_sops(keyword, search_in)
+        results = get_loader().search_sops(keyword, search_in)
         logger.info(f"Found {len(results)} matching SOPs")
         
         return results
@@ -3,14 +3,15 @@
 Start all MCP servers for the Wind Turbine Assembly Plant.
 Simplified version that uses local JSON data files.
 """
-import subprocess
+import asyncio
+import collections
 import sys
-import time
-import requests
 import os
 import signal
 import logging
-from typing import List, Dict, Any
+from typing import Deque, Dict, Any, Optional, Tuple
+
+import aiohttp
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -49,43 +50,128 @@ SERVERS = [
         "description": "Standard Operating Procedures"
     }
 ]
+SERVERS_BY_NAME = {server_config["name"]: server_config for server_config in SERVERS}
+
+# Readiness polling after a server is spawned
+READY_TIMEOUT_SECONDS = 10.0
+READY_POLL_INTERVAL_SECONDS = 0.05
+READY_CONNECT_TIMEOUT_SECONDS = 0.25
+
+# Health checks run side by side, so keep each one short
+HEALTH_TIMEOUT_SECONDS = 2
+MONITOR_INTERVAL_SECONDS = 10
+
+# Child output is drained continuously so a chatty server never blocks on a full pipe;
+# only the most recent chunks of each stream are kept for failure reports
+OUTPUT_READ_SIZE = 4096
+OUTPUT_TAIL_CHUNKS = 64
 
 class ServerManager:
     def __init__(self):
-        self.processes: List[subprocess.Popen] = []
+        # Current process for each server, keyed by server name
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        # Per process: the task draining its pipes, plus the stdout and stderr tails
+        self.output: Dict[asyncio.subprocess.Process, Tuple[asyncio.Future, Deque[bytes], Deque[bytes]]] = {}
         self.server_dir = os.path.dirname(os.path.abspath(__file__))
+        # Reused for every readiness and health request; created inside the running loop
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            # One pooled keep-alive connection per server
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=len(SERVERS)))
+        return self.session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+    
+    async def drain(self, stream: asyncio.StreamReader, tail: Deque[bytes]):
+        """Read a child pipe until EOF, keeping only its most recent output."""
+        while chunk := await stream.read(OUTPUT_READ_SIZE):
+            tail.append(chunk)
+    
+    async def wait_until_ready(self, process: asyncio.subprocess.Process, server_config: Dict[str, Any],
+                               timeout: float = READY_TIMEOUT_SECONDS,
+                               interval: float = READY_POLL_INTERVAL_SECONDS) -> bool:
+        """
+        Poll a freshly started server until its /health endpoint answers.
         
-    def start_server(self, server_config: Dict[str, Any]) -> bool:
+        Returns False as soon as the process exits. Any HTTP response counts as
+        ready, since an unhealthy data check still means the server is listening.
+        """
+        url = f"http://127.0.0.1:{server_config['port']}/health"
+        request_timeout = aiohttp.ClientTimeout(total=2, connect=READY_CONNECT_TIMEOUT_SECONDS)
+        session = self.get_session()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        while loop.time() < deadline:
+            if process.returncode is not None:
+                return False
+            try:
+                async with session.get(url, timeout=request_timeout):
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                await asyncio.sleep(interval)
+        
+        # Still running but not answering; report it and keep the process
+        if process.returncode is None:
+            logger.warning(f"⚠️  {server_config['name']} did not answer on port {server_config['port']} within {timeout:.0f}s")
+            return True
+        return False
+        
+    async def start_server(self, server_config: Dict[str, Any]) -> bool:
         """Start a single server."""
+        process = await self.spawn_server(server_config)
+        return process is not None and await self.confirm_started(process, server_config)
+    
+    async def spawn_server(self, server_config: Dict[str, Any]) -> Optional[asyncio.subprocess.Process]:
+        """Launch a server process without waiting for it to become ready."""
         script_path = os.path.join(self.server_dir, server_config["script"])
         
         if not os.path.exists(script_path):
             logger.error(f"Server script not found: {script_path}")
-            return False
+            return None
             
         try:
             logger.info(f"Starting {server_config['name']} on port {server_config['port']}...")
             
-            # Start the server process
-            process = subprocess.Popen(
-                [sys.executable, script_path],
+            # Start the server process. Running it as a module (-m) rather than by path lets the
+            # child load the script's cached bytecode instead of recompiling it on every start
+            module_name = os.path.splitext(server_config["script"])[0]
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", module_name,
                 cwd=self.server_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
             
-            self.processes.append(process)
+            stdout_tail = collections.deque(maxlen=OUTPUT_TAIL_CHUNKS)
+            stderr_tail = collections.deque(maxlen=OUTPUT_TAIL_CHUNKS)
+            drainer = asyncio.gather(self.drain(process.stdout, stdout_tail), self.drain(process.stderr, stderr_tail))
+            self.output[process] = (drainer, stdout_tail, stderr_tail)
             
-            # Give the server a moment to start
-            time.sleep(2)
+            self.processes[server_config["name"]] = process
+            return process
             
-            # Check if the process is still running
-            if process.poll() is not None:
-                stdout, stderr = process.communicate()
+        except Exception as e:
+            logger.error(f"Error starting {server_config['name']}: {e}")
+            return None
+    
+    async def confirm_started(self, process: asyncio.subprocess.Process, server_config: Dict[str, Any]) -> bool:
+        """Wait for a spawned server to come up, or fail fast if it exits."""
+        try:
+            if not await self.wait_until_ready(process, server_config):
+                # The process has exited, so its pipes reach EOF and the drain finishes
+                drainer, stdout_tail, stderr_tail = self.output.pop(process)
+                await drainer
+                stdout, stderr = b"".join(stdout_tail), b"".join(stderr_tail)
                 logger.error(f"Failed to start {server_config['name']}")
-                logger.error(f"STDOUT: {stdout}")
-                logger.error(f"STDERR: {stderr}")
+                logger.error(f"STDOUT: {stdout.decode(errors='replace')}")
+                logger.error(f"STDERR: {stderr.decode(errors='replace')}")
                 return False
                 
             logger.info(f"✅ {server_config['name']} started successfully")
@@ -95,86 +181,139 @@ class ServerManager:
             logger.error(f"Error starting {server_config['name']}: {e}")
             return False
     
-    def check_server_health(self, server_config: Dict[str, Any]) -> bool:
+    async def check_server_health(self, server_config: Dict[str, Any]) -> bool:
         """Check if a server is healthy."""
         try:
-            response = requests.get(f"http://127.0.0.1:{server_config['port']}/health", timeout=5)
-            return response.status_code == 200
-        except:
+            url = f"http://127.0.0.1:{server_config['port']}/health"
+            async with self.get_session().get(url, timeout=aiohttp.ClientTimeout(total=HEALTH_TIMEOUT_SECONDS)) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             return False
     
-    def start_all_servers(self) -> bool:
+    async def start_all_servers(self) -> bool:
         """Start all servers."""
         logger.info("🚀 Starting Wind Turbine Assembly Plant MCP Servers...")
         logger.info("=" * 60)
         
         success_count = 0
         
-        for server_config in SERVERS:
-            if self.start_server(server_config):
+        # Spawning is quick; the readiness waits are independent, so run them side by side
+        spawned = [(server_config, await self.spawn_server(server_config)) for server_config in SERVERS]
+        started = [(server_config, process) for server_config, process in spawned if process is not None]
+        
+        results = await asyncio.gather(*(
+            self.confirm_started(process, server_config) for server_config, process in started
+        ))
+        
+        for (server_config, _), ok in zip(started, results):
+            if ok:
                 success_count += 1
             else:
                 logger.error(f"❌ Failed to start {server_config['name']}")
         
+        for server_config, process in spawned:
+            if process is None:
+                logger.error(f"❌ Failed to start {server_config['name']}")
+        
         if success_count == len(SERVERS):
             logger.info("=" * 60)
             logger.info("🎉 All servers started successfully!")
-            self.print_server_status()
+            await self.print_server_status()
             return True
         else:
             logger.error(f"❌ Only {success_count}/{len(SERVERS)} servers started successfully")
             return False
     
-    def print_server_status(self):
+    async def print_server_status(self):
         """Print the status of all servers."""
         logger.info("\n📊 Server Status:")
         logger.info("-" * 60)
         
+        # All checks are in flight at once, so this takes as long as the slowest server
+        results = await asyncio.gather(*(self.check_server_health(server_config) for server_config in SERVERS))
+        health = {server_config['name']: healthy for server_config, healthy in zip(SERVERS, results)}
+        
         for server_config in SERVERS:
-            health_status = "🟢 Healthy" if self.check_server_health(server_config) else "🔴 Unhealthy"
+            health_status = "🟢 Healthy" if health[server_config['name']] else "🔴 Unhealthy"
             logger.info(f"{server_config['name']:<20} | Port {server_config['port']} | {health_status}")
             logger.info(f"{'Description:':<20} | {server_config['description']}")
             logger.info(f"{'Health Check:':<20} | http://127.0.0.1:{server_config['port']}/health")
             logger.info("-" * 60)
     
-    def stop_all_servers(self):
+    async def stop_all_servers(self):
         """Stop all running servers."""
         logger.info("🛑 Stopping all servers...")
         
-        for process in self.processes:
-            if process.poll() is None:  # Process is still running
+        for process in self.processes.values():
+            if process.returncode is None:  # Process is still running
                 try:
                     process.terminate()
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(process.wait(), timeout=5)
+                except asyncio.TimeoutError:
                     process.kill()
-                    process.wait()
+                    await process.wait()
+                except ProcessLookupError:
+                    pass
         
         self.processes.clear()
+        self.output.clear()
         logger.info("✅ All servers stopped")
     
-    def monitor_servers(self):
+    async def monitor_servers(self):
         """Monitor servers and keep them running."""
         logger.info("\n🔍 Monitoring servers... Press Ctrl+C to stop all servers")
         
         try:
             while True:
-                time.sleep(10)
+                # Wake as soon as a running child exits. asyncio's child watcher is pidfd-based
+                # on Linux, so this costs nothing while idle; the timeout retries failed restarts
+                waiters = [asyncio.ensure_future(process.wait()) for process in self.processes.values() if process.returncode is None]
+                try:
+                    if waiters:
+                        await asyncio.wait(waiters, timeout=MONITOR_INTERVAL_SECONDS, return_when=asyncio.FIRST_COMPLETED)
+                    else:
+                        await asyncio.sleep(MONITOR_INTERVAL_SECONDS)
+                finally:
+                    for waiter in waiters:
+                        waiter.cancel()
                 
                 # Check if any process has died
-                for i, process in enumerate(self.processes):
-                    if process.poll() is not None:
-                        server_config = SERVERS[i]
+                for name, process in list(self.processes.items()):
+                    if process.returncode is not None:
+                        server_config = SERVERS_BY_NAME[name]
                         logger.warning(f"⚠️  {server_config['name']} has stopped unexpectedly")
+                        self.output.pop(process, None)
                         
-                        # Try to restart
+                        # Try to restart; spawning replaces this server's entry with the new process
                         logger.info(f"🔄 Attempting to restart {server_config['name']}...")
-                        if self.start_server(server_config):
-                            self.processes[i] = self.processes[-1]  # Replace with new process
+                        await self.start_server(server_config)
                         
-        except KeyboardInterrupt:
+        except asyncio.CancelledError:
+            # asyncio.run cancels the main task on Ctrl+C
             logger.info("\n🛑 Received interrupt signal")
-            self.stop_all_servers()
+            await self.stop_all_servers()
+            raise
+    
+    async def main(self, args) -> int:
+        """Run the requested command and return the process exit code."""
+        try:
+            if args.status:
+                # Just check status
+                logger.info("📊 Checking server status...")
+                await self.print_server_status()
+                return 0
+            
+            # Start all servers
+            if await self.start_all_servers():
+                # Monitor servers
+                await self.monitor_servers()
+                return 0
+            
+            logger.error("❌ Failed to start all servers")
+            await self.stop_all_servers()
+            return 1
+        finally:
+            await self.close()
 
 def main():
     """Main function."""
@@ -186,28 +325,21 @@ def main():
     
     args = parser.parse_args()
     
-    manager = ServerManager()
-    
-    if args.status:
-        # Just check status
-        logger.info("📊 Checking server status...")
-        manager.print_server_status()
-        return
-    
     if args.stop:
         # Stop servers (this is limited since we don't track PIDs)
         logger.info("🛑 Attempting to stop servers...")
         logger.info("Note: Use Ctrl+C in the terminal where servers are running to stop them properly")
         return
     
-    # Start all servers
-    if manager.start_all_servers():
-        # Monitor servers
-        manager.monitor_servers()
-    else:
-        logger.error("❌ Failed to start all servers")
-        manager.stop_all_servers()
-        sys.exit(1)
+    manager = ServerManager()
+    
+    try:
+        exit_code = asyncio.run(manager.main(args))
+    except KeyboardInterrupt:
+        exit_code = 0
+    
+    if exit_code:
+        sys.exit(exit_code)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,19 +3,27 @@ WPMS (Workforce Planning and Management System) MCP Server
 Provides workforce and employee management tools using local JSON data.
 """
 from fastmcp import FastMCP
+from starlette.responses import Response
+import asyncio
 import datetime
-import uuid
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from json_data_loader import data_loader
+from server_utils import dumps, json_response, make_error_handler, make_id_suffix_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('WPMS-Server')
+handle_errors = make_error_handler(logger)
 
 # Initialize FastMCP
 mcp = FastMCP("WPMS Server 👥")
 
+# Server start time for reporting; uptime is measured on the monotonic clock
+STARTED_AT = datetime.datetime.now()
+STARTED_MONOTONIC = time.monotonic()
+
 # Server metadata
 SERVER_INFO = {
     "name": "WPMS Server",
@@ -23,18 +31,20 @@ SERVER_INFO = {
     "description": "Workforce Planning and Management System - Wind Turbine Assembly Plant",
     "port": 8004,
     "status": "running",
-    "started_at": datetime.datetime.now().isoformat(),
+    "started_at": STARTED_AT.isoformat(),
     "data_source": "local_json_files"
 }
 
+# Upper bound on the data check, so a slow disk can't hang the health endpoint
+HEALTH_DATA_TIMEOUT_SECONDS = 2.0
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
     """Health check endpoint."""
     try:
-        from starlette.responses import JSONResponse
-        
-        # Test data loading
-        wpms_data = data_loader.get_wpms_data()
+        # Test data loading off the event loop, giving up after a bounded wait
+        async with asyncio.timeout(HEALTH_DATA_TIMEOUT_SECONDS):
+            wpms_data = await asyncio.to_thread(data_loader.get_wpms_data)
         data_status = "healthy" if wpms_data.get("data") else "unhealthy"
         
         health_data = {
@@ -43,40 +53,50 @@ async def health_check(request):
             "server": "WPMS",
             "port": 8004,
             "data_source": "local_json_files",
-            "uptime_seconds": (datetime.datetime.now() - datetime.datetime.fromisoformat(SERVER_INFO["started_at"])).total_seconds()
+            "uptime_seconds": time.monotonic() - STARTED_MONOTONIC
         }
         
-        return JSONResponse(content=health_data, status_code=200 if data_status == "healthy" else 503)
+        return json_response(health_data, status_code=200 if data_status == "healthy" else 503)
+    except TimeoutError:
+        logger.error("Health check timed out loading WPMS data after %ss", HEALTH_DATA_TIMEOUT_SECONDS)
+        return json_response({"status": "unhealthy", "message": "Timed out loading WPMS data"}, status_code=503)
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return JSONResponse(content={"status": "error", "message": str(e)}, status_code=500)
+        return json_response({"status": "error", "message": str(e)}, status_code=500)
+
+# SERVER_INFO is static after startup, so serialize it once
+SERVER_INFO_BYTES = dumps(SERVER_INFO)
 
 @mcp.custom_route("/info", methods=["GET"])
 async def server_info(request):
     """Server information endpoint."""
-    from starlette.responses import JSONResponse
-    return JSONResponse(content=SERVER_INFO)
+    return Response(content=SERVER_INFO_BYTES, media_type="application/json")
 
-def handle_errors(func):
-    """Error handling decorator."""
-    def wrapper(*args, **kwargs):
-        try:
-            result = func(*args, **kwargs)
-            logger.debug(f"Tool {func.__name__} executed successfully")
-            return result
-        except Exception as e:
-            logger.error(f"Error in tool {func.__name__}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "tool": func.__name__,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-    return wrapper
+# Shared immutable result for lookups that match nothing
+_EMPTY = ()
+
+# Schedule statuses that take an employee off the shift
+_UNAVAILABLE_STATUSES = frozenset({"absent"})
+
+# Random assignment ID suffixes, drawn from the CSPRNG in batches rather than per assignment
+ID_SUFFIX_LENGTH = 3
+ID_POOL_SIZE = 1024
+_next_id_suffix = make_id_suffix_pool(ID_SUFFIX_LENGTH, ID_POOL_SIZE)
+
+# Compact date used in assignment IDs, reformatted only when the day changes
+_date_key, _date_str = None, ""
+
+def _date_prefix(now: datetime.datetime) -> str:
+    """Return now as YYYYMMDD, reusing the cached string within the same day."""
+    global _date_key, _date_str
+    today = now.date()
+    if today != _date_key:
+        _date_key, _date_str = today, now.strftime('%Y%m%d')
+    return _date_str
 
-@handle_errors
 @mcp.tool
-def get_factory_management() -> Dict[str, Any]:
+@handle_errors
+async def get_factory_management() -> Dict[str, Any]:
     """
     Get factory management and organizational information.
     
@@ -97,9 +117,9 @@ def get_factory_management() -> Dict[str, Any]:
         "purchasing_department": management.get("purchasing_department", {})
     }
 
-@handle_errors
 @mcp.tool
-def get_employees(role: Optional[str] = None, shift: Optional[str] = None, department: Optional[str] = None) -> Dict[str, Any]:
+@handle_errors
+async def get_employees(role: Optional[str] = None, shift: Optional[str] = None, department: Optional[str] = None) -> Dict[str, Any]:
     """
     Get employee information, optionally filtered by role, shift, and/or department.
     
@@ -113,17 +133,27 @@ def get_employees(role: Optional[str] = None, shift: Optional[str] = None, depar
     """
     logger.info(f"Getting employees - role: {role}, shift: {shift}, department: {department}")
     
-    wpms_data = data_loader.get_wpms_data()
-    employees = wpms_data.get("data", {}).get("employees", [])
+    employees = data_loader.get_wpms_section("employees")
+    
+    # Normalise the filters once, then apply them all in a single pass
+    role_l = role.lower() if role else None
+    shift_l = shift.lower() if shift else None
+    department_f = department or None
+    
+    # No filters: serve the cached section as-is
+    if not (role_l or shift_l or department_f):
+        return {
+            "success": True,
+            "employees": employees,
+            "total_employees": len(employees)
+        }
     
-    # Apply filters
-    filtered_employees = employees
-    if role:
-        filtered_employees = [e for e in filtered_employees if e.get("role") == role.lower()]
-    if shift:
-        filtered_employees = [e for e in filtered_employees if e.get("shift") == shift.lower()]
-    if department:
-        filtered_employees = [e for e in filtered_employees if e.get("department") == department]
+    filtered_employees = [
+        e for e in employees
+        if (role_l is None or e.get("role") == role_l)
+        and (shift_l is None or e.get("shift") == shift_l)
+        and (department_f is None or e.get("department") == department_f)
+    ]
     
     return {
         "success": True,
@@ -131,9 +161,9 @@ def get_employees(role: Optional[str] = None, shift: Optional[str] = None, depar
         "total_employees": len(filtered_employees)
     }
 
-@handle_errors
 @mcp.tool
-def get_employee_skills(employee_id: str) -> Dict[str, Any]:
+@handle_errors
+async def get_employee_skills(employee_id: str) -> Dict[str, Any]:
     """
     Get skills and certifications for a specific employee.
     
@@ -145,15 +175,11 @@ def get_employee_skills(employee_id: str) -> Dict[str, Any]:
     """
     logger.info(f"Getting skills for employee: {employee_id}")
     
-    wpms_data = data_loader.get_wpms_data()
-    employee_skills = wpms_data.get("data", {}).get("employee_skills", [])
-    
-    # Filter skills for specific employee
-    skills = [es for es in employee_skills if es.get("employee_id") == employee_id]
+    # Skills for this employee from the pre-built index
+    skills = data_loader.get_wpms_index("employee_skills", "employee_id").get(employee_id, _EMPTY)
     
     # Get employee details
-    employees = wpms_data.get("data", {}).get("employees", [])
-    employee = next((e for e in employees if e.get("employee_id") == employee_id), None)
+    employee = data_loader.get_employee_by_id(employee_id)
     
     if not employee:
         return {
@@ -168,9 +194,9 @@ def get_employee_skills(employee_id: str) -> Dict[str, Any]:
         "total_skills": len(skills)
     }
 
-@handle_errors
 @mcp.tool
-def get_machine_assignments(employee_id: Optional[str] = None, machine_id: Optional[str] = None) -> Dict[str, Any]:
+@handle_errors
+async def get_machine_assignments(employee_id: Optional[str] = None, machine_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Get machine assignments, optionally filtered by employee ID and/or machine ID.
     
@@ -183,15 +209,15 @@ def get_machine_assignments(employee_id: Optional[str] = None, machine_id: Optio
     """
     logger.info(f"Getting machine assignments - employee: {employee_id}, machine: {machine_id}")
     
-    wpms_data = data_loader.get_wpms_data()
-    assignments = wpms_data.get("data", {}).get("machine_assignments", [])
-    
-    # Apply filters
-    filtered_assignments = assignments
-    if employee_id:
-        filtered_assignments = [a for a in filtered_assignments if a.get("employee_id") == employee_id]
-    if machine_id:
-        filtered_assignments = [a for a in filtered_assignments if a.get("machine_id") == machine_id]
+    # Apply filters using the pre-built indexes
+    if employee_id and machine_id:
+        filtered_assignments = data_loader.get_wpms_index("machine_assignments", ("employee_id", "machine_id")).get((employee_id, machine_id), _EMPTY)
+    elif employee_id:
+        filtered_assignments = data_loader.get_wpms_index("machine_assignments", "employee_id").get(employee_id, _EMPTY)
+    elif machine_id:
+        filtered_assignments = data_loader.get_wpms_index("machine_assignments", "machine_id").get(machine_id, _EMPTY)
+    else:
+        filtered_assignments = data_loader.get_wpms_section("machine_assignments")
     
     return {
         "success": True,
@@ -199,9 +225,9 @@ def get_machine_assignments(employee_id: Optional[str] = None, machine_id: Optio
         "total_assignments": len(filtered_assignments)
     }
 
-@handle_errors
 @mcp.tool
-def get_shift_schedules(employee_id: Optional[str] = None, date: Optional[str] = None) -> Dict[str, Any]:
+@handle_errors
+async def get_shift_schedules(employee_id: Optional[str] = None, date: Optional[str] = None) -> Dict[str, Any]:
     """
     Get shift schedules, optionally filtered by employee ID and/or date.
     
@@ -214,15 +240,15 @@ def get_shift_schedules(employee_id: Optional[str] = None, date: Optional[str] =
     """
     logger.info(f"Getting shift schedules - employee: {employee_id}, date: {date}")
     
-    wpms_data = data_loader.get_wpms_data()
-    schedules = wpms_data.get("data", {}).get("shift_schedules", [])
-    
-    # Apply filters
-    filtered_schedules = schedules
-    if employee_id:
-        filtered_schedules = [s for s in filtered_schedules if s.get("employee_id") == employee_id]
-    if date:
-        filtered_schedules = [s for s in filtered_schedules if s.get("date") == date]
+    # Apply filters using the pre-built indexes
+    if employee_id and date:
+        filtered_schedules = data_loader.get_wpms_index("shift_schedules", ("employee_id", "date")).get((employee_id, date), _EMPTY)
+    elif employee_id:
+        filtered_schedules = data_loader.get_wpms_index("shift_schedules", "employee_id").get(employee_id, _EMPTY)
+    elif date:
+        filtered_schedules = data_loader.get_wpms_index("shift_schedules", "date").get(date, _EMPTY)
+    else:
+        filtered_schedules = data_loader.get_wpms_section("shift_schedules")
     
     return {
         "success": True,
@@ -230,9 +256,9 @@ def get_shift_schedules(employee_id: Optional[str] = None, date: Optional[str] =
         "total_schedules": len(filtered_schedules)
     }
 
-@handle_errors
 @mcp.tool
-def get_workforce_metrics() -> Dict[str, Any]:
+@handle_errors
+async def get_workforce_metrics() -> Dict[str, Any]:
     """
     Get workforce metrics and KPIs.
     
@@ -241,8 +267,7 @@ def get_workforce_metrics() -> Dict[str, Any]:
     """
     logger.info("Getting workforce metrics")
     
-    wpms_data = data_loader.get_wpms_data()
-    workforce_metrics = wpms_data.get("data", {}).get("workforce_metrics", {})
+    workforce_metrics = data_loader.get_wpms_section("workforce_metrics") or {}
     
     return {
         "success": True,
@@ -250,9 +275,9 @@ def get_workforce_metrics() -> Dict[str, Any]:
         "timestamp": datetime.datetime.now().isoformat()
     }
 
-@handle_errors
 @mcp.tool
-def get_training_records(employee_id: Optional[str] = None) -> Dict[str, Any]:
+@handle_errors
+async def get_training_records(employee_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Get training records, optionally for a specific employee.
     
@@ -264,12 +289,9 @@ def get_training_records(employee_id: Optional[str] = None) -> Dict[str, Any]:
     """
     logger.info(f"Getting training records for employee: {employee_id}")
     
-    wpms_data = data_loader.get_wpms_data()
-    training_records = wpms_data.get("data", {}).get("training_records", [])
-    
     if employee_id:
-        # Filter training records for specific employee
-        employee_training = [tr for tr in training_records if tr.get("employee_id") == employee_id]
+        # Training records for specific employee from the pre-built index
+        employee_training = data_loader.get_wpms_index("training_records", "employee_id").get(employee_id, _EMPTY)
         return {
             "success": True,
             "training_records": employee_training,
@@ -278,15 +300,16 @@ def get_training_records(employee_id: Optional[str] = None) -> Dict[str, Any]:
         }
     else:
         # Return all training records
+        training_records = data_loader.get_wpms_section("training_records")
         return {
             "success": True,
             "training_records": training_records,
             "total_records": len(training_records)
         }
 
-@handle_errors
 @mcp.tool
-def find_qualified_employees(machine_id: str, min_skill_level: int = 3) -> Dict[str, Any]:
+@handle_errors
+async def find_qualified_employees(machine_id: str, min_skill_level: int = 3) -> Dict[str, Any]:
     """
     Find employees qualified to operate a specific machine.
     
@@ -299,19 +322,13 @@ def find_qualified_employees(machine_id: str, min_skill_level: int = 3) -> Dict[
     """
     logger.info(f"Finding qualified employees for machine {machine_id} with min skill level {min_skill_level}")
     
-    wpms_data = data_loader.get_wpms_data()
-    employee_skills = wpms_data.get("data", {}).get("employee_skills", [])
-    employees = wpms_data.get("data", {}).get("employees", [])
-    
-    # Find employees with skills for this machine
-    qualified_skills = [es for es in employee_skills 
-                       if es.get("machine_id") == machine_id and 
-                       es.get("skill_level", 0) >= min_skill_level]
-    
-    # Get employee details for qualified employees
+    # Join this machine's qualifying skills to their employees in a single pass
+    employees_by_id = data_loader.get_wpms_lookup("employees", "employee_id")
     qualified_employees = []
-    for skill in qualified_skills:
-        employee = next((e for e in employees if e.get("employee_id") == skill.get("employee_id")), None)
+    for skill in data_loader.get_wpms_index("employee_skills", "machine_id").get(machine_id, _EMPTY):
+        if skill.get("skill_level", 0) < min_skill_level:
+            continue
+        employee = employees_by_id.get(skill.get("employee_id"))
         if employee:
             qualified_employees.append({
                 "employee": employee,
@@ -329,9 +346,9 @@ def find_qualified_employees(machine_id: str, min_skill_level: int = 3) -> Dict[
         "total_qualified": len(qualified_employees)
     }
 
-@handle_errors
 @mcp.tool
-def get_available_employees(shift: str, date: str) -> Dict[str, Any]:
+@handle_errors
+async def get_available_employees(shift: str, date: str) -> Dict[str, Any]:
     """
     Get employees available for a specific shift and date.
     
@@ -344,20 +361,16 @@ def get_available_employees(shift: str, date: str) -> Dict[str, Any]:
     """
     logger.info(f"Getting available employees for {shift} shift on {date}")
     
-    wpms_data = data_loader.get_wpms_data()
-    shift_schedules = wpms_data.get("data", {}).get("shift_schedules", [])
-    employees = wpms_data.get("data", {}).get("employees", [])
-    
     # Find employees scheduled for this shift and date who are not absent
-    available_schedules = [s for s in shift_schedules 
-                          if s.get("shift") == shift.lower() and 
-                          s.get("date") == date and 
-                          s.get("status") not in ["absent"]]
+    shift_l = shift.lower()
+    available_schedules = [s for s in data_loader.get_wpms_index("shift_schedules", ("shift", "date")).get((shift_l, date), _EMPTY)
+                          if s.get("status") not in _UNAVAILABLE_STATUSES]
     
-    # Get employee details
+    # Get employee details, resolving the lookup once
+    employees_by_id = data_loader.get_wpms_lookup("employees", "employee_id")
     available_employees = []
     for schedule in available_schedules:
-        employee = next((e for e in employees if e.get("employee_id") == schedule.get("employee_id")), None)
+        employee = employees_by_id.get(schedule.get("employee_id"))
         if employee:
             available_employees.append({
                 "employee": employee,
@@ -372,9 +385,9 @@ def get_available_employees(shift: str, date: str) -> Dict[str, Any]:
         "total_available": len(available_employees)
     }
 
-@handle_errors
 @mcp.tool
-def create_machine_assignment(employee_id: str, machine_id: str, start_time: str, end_time: str, assignment_type: str = "operation") -> Dict[str, Any]:
+@handle_errors
+async def create_machine_assignment(employee_id: str, machine_id: str, start_time: str, end_time: str, assignment_type: str = "operation") -> Dict[str, Any]:
     """
     Create a new machine assignment for an employee.
     
@@ -391,9 +404,7 @@ def create_machine_assignment(employee_id: str, machine_id: str, start_time: str
     logger.info(f"Creating machine assignment - employee: {employee_id}, machine: {machine_id}")
     
     # Validate employee exists
-    wpms_data = data_loader.get_wpms_data()
-    employees = wpms_data.get("data", {}).get("employees", [])
-    employee = next((e for e in employees if e.get("employee_id") == employee_id), None)
+    employee = data_loader.get_employee_by_id(employee_id)
     if not employee:
         return {
             "success": False,
@@ -409,7 +420,7 @@ def create_machine_assignment(employee_id: str, machine_id: str, start_time: str
         }
     
     # Generate assignment ID
-    assignment_id = f"ASSIGN-{datetime.datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:3]}"
+    assignment_id = f"ASSIGN-{_date_prefix(datetime.datetime.now())}-{_next_id_suffix()}"
     
     assignment = {
         "assignment_id": assignment_id,